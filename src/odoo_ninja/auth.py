@@ -4,6 +4,11 @@ from typing import Any
 
 from odoo_ninja.client import OdooClient
 
+# Lookups that do not change during a session, keyed by (url, database, ...)
+_user_id_cache: dict[tuple[str, str, str], int] = {}
+_partner_id_cache: dict[tuple[str, str, int], int] = {}
+_subtype_cache: dict[tuple[str, str, str], int | bool] = {}
+
 
 def get_default_user_id(client: OdooClient, username: str | None = None) -> int:
     """Get the default user ID for sudo operations.
@@ -20,12 +25,17 @@ def get_default_user_id(client: OdooClient, username: str | None = None) -> int:
 
     """
     search_username = username or client.username
+    key = (client.url, client.db, search_username)
+    if key in _user_id_cache:
+        return _user_id_cache[key]
+
     user_ids = client.search("res.users", domain=[("login", "=", search_username)], limit=1)
 
     if not user_ids:
         msg = f"User '{search_username}' not found"
         raise ValueError(msg)
 
+    _user_id_cache[key] = user_ids[0]
     return user_ids[0]
 
 
@@ -46,6 +56,10 @@ def get_partner_id_from_user(client: OdooClient, user_id: int) -> int:
         ValueError: If user not found or has no partner
 
     """
+    key = (client.url, client.db, user_id)
+    if key in _partner_id_cache:
+        return _partner_id_cache[key]
+
     users = client.read("res.users", [user_id], ["partner_id"])
     if not users:
         msg = f"User {user_id} not found"
@@ -57,10 +71,30 @@ def get_partner_id_from_user(client: OdooClient, user_id: int) -> int:
         raise ValueError(msg)
 
     # partner_id is returned as [id, name] tuple
-    if isinstance(partner_id, list):
-        result: int = partner_id[0]
-        return result
-    return int(partner_id)
+    result = int(partner_id[0]) if isinstance(partner_id, list) else int(partner_id)
+    _partner_id_cache[key] = result
+    return result
+
+
+def _get_subtype_id(client: OdooClient, name: str) -> int | bool:
+    """Get the ID of a mail.message.subtype by name.
+
+    Subtypes are effectively constant per database, so the lookup is cached for the
+    lifetime of the process.
+
+    Args:
+        client: Odoo client
+        name: Subtype name (e.g., 'Note', 'Discussions')
+
+    Returns:
+        Subtype ID, or False if no such subtype exists
+
+    """
+    key = (client.url, client.db, name)
+    if key not in _subtype_cache:
+        subtype_ids = client.search("mail.message.subtype", domain=[("name", "=", name)], limit=1)
+        _subtype_cache[key] = subtype_ids[0] if subtype_ids else False
+    return _subtype_cache[key]
 
 
 def message_post_sudo(
@@ -106,17 +140,14 @@ def message_post_sudo(
     # This avoids the XML-RPC marshalling issue with message_post
 
     # For notes, we want the "Note" subtype, for comments we want "Discussions"
-    subtype_name = "Note" if is_note else "Discussions"
-    subtype_ids = client.search(
-        "mail.message.subtype", domain=[("name", "=", subtype_name)], limit=1
-    )
+    subtype_id = _get_subtype_id(client, "Note" if is_note else "Discussions")
 
     message_vals = {
         "model": model,
         "res_id": res_id,
         "body": body,
         "message_type": message_type,
-        "subtype_id": subtype_ids[0] if subtype_ids else False,
+        "subtype_id": subtype_id,
         "author_id": partner_id,  # Use partner_id, not user_id
         **kwargs,
     }
@@ -124,3 +155,59 @@ def message_post_sudo(
     # Create the message
     message_id = client.create("mail.message", message_vals)
     return bool(message_id)
+
+
+def messages_post_sudo(
+    client: OdooClient,
+    model: str,
+    posts: list[tuple[int, str]],
+    *,
+    user_id: int | None = None,
+    message_type: str = "comment",
+    is_note: bool = False,
+) -> list[int]:
+    """Post messages or notes on several records as a specific user in one call.
+
+    All messages are created by a single mail.message create() with a list of
+    values, so posting to N records costs one round trip instead of N.
+
+    Args:
+        client: Odoo client
+        model: Model name (e.g., 'helpdesk.ticket')
+        posts: (record_id, HTML body) pairs
+        user_id: User ID to post as (uses default if None)
+        message_type: Type of message ('comment' or 'notification')
+        is_note: If True, creates internal notes (not visible to customers)
+
+    Returns:
+        IDs of the created messages, in the order of posts
+
+    Raises:
+        ValueError: If no default user configured
+
+    """
+    if not posts:
+        return []
+
+    if user_id is None:
+        if client.config.default_user_id is None:
+            msg = "No default user ID configured"
+            raise ValueError(msg)
+        user_id = client.config.default_user_id
+
+    partner_id = get_partner_id_from_user(client, user_id)
+    subtype_id = _get_subtype_id(client, "Note" if is_note else "Discussions")
+
+    vals_list = [
+        {
+            "model": model,
+            "res_id": res_id,
+            "body": body,
+            "message_type": message_type,
+            "subtype_id": subtype_id,
+            "author_id": partner_id,
+        }
+        for res_id, body in posts
+    ]
+    message_ids: list[int] = client.execute("mail.message", "create", vals_list)
+    return message_ids
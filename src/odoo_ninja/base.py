@@ -1,30 +1,155 @@
 """Base operations for Odoo models - shared functionality."""
 
+import asyncio
 import base64
+import contextlib
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from html import escape, unescape
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from rich.table import Table
-
-from odoo_ninja.auth import message_post_sudo
+from odoo_ninja.auth import message_post_sudo, messages_post_sudo
 from odoo_ninja.client import OdooClient
+from odoo_ninja.config import get_cache_dir
 
 if TYPE_CHECKING:
+    from markdown import Markdown
     from rich.console import Console
 
 
+# Field assignment: name, operator (=, +=, -=, *=, /=) and value
+_FIELD_ASSIGN_RE = re.compile(r"^([^=+\-*/]+)([+\-*/]?=)(.+)$")
+# Assigned value kinds, tried in order; match.lastgroup names the kind
+_VALUE_RE = re.compile(
+    r"(?P<json>json:)"
+    r"|(?P<int>-?\d+)\Z"
+    r"|(?P<float>-?(?:\d+\.\d*|\.\d+))\Z"
+    r"|(?P<bool>(?i:true|false))\Z"
+    r"|(?P<quoted>\"(?s:.*)\"|'(?s:.*)')\Z"
+)
+# Markup stripped by _html_to_text(), tokenized like HTMLParser: comments,
+# declarations, processing instructions and bogus end tags ("</ p>"), then tags,
+# which must start with a letter (so "x < y" stays text). Quotes only delimit
+# values after '=', which may then contain '>'; unquoted values run up to
+# whitespace or '>'.
+_HTML_MARKUP_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<[!?][^>]*>"
+    r"|</(?![A-Za-z])[^>]*>"
+    r"|</?[A-Za-z](?:[^>=]|=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]*))*>",
+    re.DOTALL,
+)
+
+
+# Default fields for chatter and attachment listings; keep in sync with what the
+# display_* helpers below actually render.
+_MESSAGE_FIELDS = [
+    "id",
+    "date",
+    "author_id",
+    "body",
+    "subject",
+    "message_type",
+    "subtype_id",
+    "email_from",
+]
+_ATTACHMENT_FIELDS = ["id", "name", "file_size", "mimetype", "create_date"]
+
+# list_tags results by (url, database, tag model) with the time they were fetched
+_TAGS_TTL = 60.0
+_tags_cache: dict[tuple[str, str, str], tuple[float, list[dict[str, Any]]]] = {}
+
+# fields_get results by (url, database, model, attributes), see list_fields()
+_fields_cache: dict[tuple[str, str, str, tuple[str, ...] | None], dict[str, Any]] = {}
+# Seconds a fields_get result cached on disk is reused by later CLI runs
+_FIELDS_DISK_TTL = 24 * 60 * 60
+
+
+@cache
+def _cli_module() -> ModuleType:
+    """Get the CLI module that owns the shared console.
+
+    Returns:
+        The odoo_ninja.main module
+
+    """
+    import odoo_ninja.main
+
+    return odoo_ninja.main
+
+
 def _get_console() -> "Console":
     """Get console instance from main module.
 
+    The console is looked up on every call because the CLI replaces it when
+    --no-color is given; only the module import is cached.
+
     Returns:
         Console instance
 
     """
-    from odoo_ninja.main import console
-
+    console: Console = _cli_module().console
     return console
 
 
+# Base64 works on 4-character groups, so the chunk size must be a multiple of 4
+_B64_DECODE_CHUNK = 64 * 1024
+
+# Worker threads used to write downloaded attachments to disk
+DOWNLOAD_WORKERS = 8
+
+
+def _write_base64(path: Path, data: str) -> None:
+    """Decode base64 data into a file chunk by chunk.
+
+    Avoids holding a decoded copy of the whole file in memory next to the encoded string.
+
+    Args:
+        path: Output file path
+        data: Base64-encoded file content
+
+    """
+    # Chunks must stay aligned to 4-character groups, so drop all whitespace
+    # (e.g. CRLF line breaks) first, as a single b64decode() would ignore it
+    data = "".join(data.split())
+    with path.open("wb") as f:
+        for start in range(0, len(data), _B64_DECODE_CHUNK):
+            f.write(base64.b64decode(data[start : start + _B64_DECODE_CHUNK]))
+
+
+def _read_base64(path: Path) -> str:
+    """Read a file and return its content base64-encoded.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Base64-encoded file content
+
+    """
+    with path.open("rb") as f:
+        # Encoding straight from a read-only mapping skips the raw-bytes copy;
+        # files that cannot be mapped (empty files, /proc entries reporting no
+        # size, filesystems without mmap support) are read normally instead
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return base64.b64encode(f.read()).decode("ascii")
+        with mapped:
+            return base64.b64encode(mapped).decode("ascii")
+
+
 def list_records(
     client: OdooClient,
     model: str,
@@ -56,6 +181,58 @@ def list_records(
     )
 
 
+def _m2o_name(record: dict[str, Any], field_name: str) -> Any:
+    """Get the display name of a many2one field.
+
+    Args:
+        record: Record dictionary
+        field_name: Many2one field name
+
+    Returns:
+        Name part of the [id, name] pair, or None if the field is empty
+
+    """
+    value = record.get(field_name)
+    return value[1] if type(value) is list and value else None
+
+
+def _format_list_value(value: list[Any]) -> str:
+    """Format a list value for a table cell.
+
+    Args:
+        value: Many2one pair [id, name] or list of x2many IDs
+
+    Returns:
+        Record name for many2one values, the ID list otherwise
+
+    """
+    # Odoo values are plain builtins, so exact type checks are safe here
+    if len(value) == 2 and type(value[0]) is int:
+        return str(value[1])
+    return str(value)
+
+
+# Cell formatters for display_records, keyed by the exact type of the value.
+# Odoo returns False for empty fields of any type; types not listed use str().
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda value: "N/A" if value is False else str(value),
+    type(None): lambda _: "N/A",
+    list: _format_list_value,
+    str: lambda value: value,
+}
+
+# Column styles used by display_records; other fields are shown in white
+_FIELD_STYLES = {
+    "id": "cyan",
+    "name": "green",
+    "partner_id": "yellow",
+    "stage_id": "blue",
+    "user_id": "magenta",
+    "priority": "red",
+    "project_id": "blue",
+}
+
+
 def display_records(records: list[dict[str, Any]], title: str = "Records") -> None:
     """Display records in a rich table.
 
@@ -64,6 +241,8 @@ def display_records(records: list[dict[str, Any]], title: str = "Records") -> No
         title: Table title
 
     """
+    from rich.table import Table
+
     console = _get_console()
     if not records:
         console.print("[yellow]No records found[/yellow]")
@@ -72,44 +251,22 @@ def display_records(records: list[dict[str, Any]], title: str = "Records") -> No
     table = Table(title=title)
 
     # Get all field names from the first record
-    field_names = list(records[0].keys())
+    field_names = tuple(records[0])
 
     # Add columns for each field with styling
-    field_styles = {
-        "id": "cyan",
-        "name": "green",
-        "partner_id": "yellow",
-        "stage_id": "blue",
-        "user_id": "magenta",
-        "priority": "red",
-        "project_id": "blue",
-    }
-
     for field_name in field_names:
-        style = field_styles.get(field_name, "white")
+        style = _FIELD_STYLES.get(field_name, "white")
         table.add_column(field_name, style=style)
 
-    # Add rows
-    for record in records:
-        row_values = []
-        for field_name in field_names:
-            value = record.get(field_name)
-
-            # Format the value
-            if value is False or value is None:
-                formatted_value = "N/A"
-            elif isinstance(value, list) and len(value) == 2 and isinstance(value[0], int):
-                # Many2one field [id, name]
-                formatted_value = value[1]
-            elif isinstance(value, list):
-                # Many2many or one2many field
-                formatted_value = str(value)
-            else:
-                formatted_value = str(value)
-
-            row_values.append(formatted_value)
-
-        table.add_row(*row_values)
+    # Format every row up front, then feed them to the table in one tight loop
+    formatters = _FORMATTERS
+    rows = [
+        tuple(formatters.get(type(value), str)(value) for value in map(record.get, field_names))
+        for record in records
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
@@ -142,19 +299,139 @@ def get_record(
     return records[0]
 
 
-def list_fields(client: OdooClient, model: str) -> dict[str, Any]:
+def get_records(
+    client: OdooClient,
+    model: str,
+    record_ids: list[int],
+    fields: list[str] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Get several records in a single read.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_ids: Record IDs
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Dictionary mapping record ID to record dictionary (missing IDs are absent)
+
+    """
+    if not record_ids:
+        return {}
+    return {record["id"]: record for record in client.read(model, record_ids, fields=fields)}
+
+
+def list_fields(
+    client: OdooClient,
+    model: str,
+    attributes: list[str] | None = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
     """Get all available fields for a model.
 
+    fields_get is expensive on the server and its result rarely changes, so
+    results are cached per server, database, model and requested attributes for
+    the lifetime of the process, and on disk for later runs (see _FIELDS_DISK_TTL).
+
+    Args:
+        client: Odoo client
+        model: Model name
+        attributes: Field attributes to return (None = all attributes), e.g.
+            ['type', 'string'] to skip translated help texts and selections
+        refresh: Fetch the definitions from Odoo even if they are cached, e.g.
+            after installing a module, and update the caches
+
+    Returns:
+        Dictionary of field definitions with field names as keys, sorted by name
+
+    """
+    key = (client.url, client.db, model, tuple(attributes) if attributes is not None else None)
+    if refresh or key not in _fields_cache:
+        cache_file = _fields_cache_file(client, model, attributes)
+        result = None if refresh else _load_cached_fields(cache_file)
+        if result is None:
+            if attributes is not None:
+                result = client.execute(model, "fields_get", attributes=attributes)
+            else:
+                result = client.execute(model, "fields_get")
+            # Sorted once here, so callers listing fields need not sort again
+            result = dict(sorted(result.items()))
+            _store_cached_fields(cache_file, result)
+        _fields_cache[key] = result
+    return _fields_cache[key]
+
+
+def _fields_cache_file(client: OdooClient, model: str, attributes: list[str] | None) -> Path:
+    """Get the on-disk cache file for a fields_get call.
+
+    Field labels and help texts are translated, so the login is part of the key.
+
     Args:
         client: Odoo client
         model: Model name
+        attributes: Requested field attributes (None = all attributes)
+
+    Returns:
+        Cache file path (may not exist)
+
+    """
+    requested = ",".join(attributes) if attributes is not None else "*"
+    key = "\0".join((client.url, client.db, client.username, model, requested))
+    return get_cache_dir() / "fields" / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def _load_cached_fields(cache_file: Path) -> dict[str, Any] | None:
+    """Read a fields_get result cached by an earlier run.
+
+    Args:
+        cache_file: Cache file from _fields_cache_file()
 
     Returns:
-        Dictionary of field definitions with field names as keys
+        Field definitions, or None if not cached or older than _FIELDS_DISK_TTL
+
+    """
+    try:
+        if time.time() - cache_file.stat().st_mtime > _FIELDS_DISK_TTL:
+            return None
+        result = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _store_cached_fields(cache_file: Path, result: dict[str, Any]) -> None:
+    """Write a fields_get result to the on-disk cache.
+
+    The file is replaced atomically; failures are ignored since the cache is
+    only an optimization.
+
+    Args:
+        cache_file: Cache file from _fields_cache_file()
+        result: Field definitions returned by fields_get
 
     """
-    result: dict[str, Any] = client.execute(model, "fields_get")
-    return result
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(result), encoding="utf-8")
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+
+
+def clear_schema_cache() -> None:
+    """Forget the cached field definitions and tags.
+
+    Clears the in-process caches and deletes the field definitions cached on
+    disk, so later list_fields() and list_tags() calls fetch them from Odoo.
+    Files that cannot be deleted are left for _FIELDS_DISK_TTL to expire.
+    """
+    _fields_cache.clear()
+    _tags_cache.clear()
+    for cache_file in (get_cache_dir() / "fields").glob("*.json"):
+        with contextlib.suppress(OSError):
+            cache_file.unlink()
 
 
 def set_record_fields(
@@ -182,6 +459,118 @@ def set_record_fields(
     return client.write(model, [record_id], values)
 
 
+def set_records_fields(
+    client: OdooClient,
+    model: str,
+    record_ids: list[int],
+    values: dict[str, Any],
+) -> bool:
+    """Set the same field values on several records in a single write.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_ids: Record IDs
+        values: Dictionary of field names and values to update
+
+    Returns:
+        True if successful
+
+    Examples:
+        >>> set_records_fields(client, "project.task", [42, 43], {"stage_id": 3})
+
+    """
+    return client.write(model, record_ids, values)
+
+
+class UpdateBatch:
+    """Collect field updates and send them in as few write calls as possible.
+
+    Values set for the same record are merged, and records that end up with
+    equal values are written together, since write() accepts a list of IDs.
+    Pending updates are sent when the block exits without an exception.
+
+    Examples:
+        >>> with UpdateBatch(client, "project.task") as batch:
+        ...     batch.set(42, {"name": "New title"})
+        ...     batch.set(42, {"stage_id": 3})
+        ...     batch.set(43, {"stage_id": 3})
+
+    """
+
+    def __init__(self, client: OdooClient, model: str) -> None:
+        """Create an empty batch.
+
+        Args:
+            client: Odoo client
+            model: Model name
+
+        """
+        self.client = client
+        self.model = model
+        self.pending: dict[int, dict[str, Any]] = {}
+
+    def set(self, record_id: int, values: dict[str, Any]) -> None:
+        """Queue field updates for a record.
+
+        Args:
+            record_id: Record ID
+            values: Dictionary of field names and values to update
+
+        """
+        self.pending.setdefault(record_id, {}).update(values)
+
+    def flush(self) -> bool:
+        """Send the pending updates, one write per distinct values dictionary.
+
+        Returns:
+            True if all writes succeeded
+
+        """
+        groups: list[tuple[dict[str, Any], list[int]]] = []
+        for record_id, values in self.pending.items():
+            for group_values, record_ids in groups:
+                if group_values == values:
+                    record_ids.append(record_id)
+                    break
+            else:
+                groups.append((values, [record_id]))
+        self.pending = {}
+        results = [
+            set_records_fields(self.client, self.model, ids, values) for values, ids in groups
+        ]
+        return all(results)
+
+    def __enter__(self) -> "UpdateBatch":
+        """Use the batch as a context manager that flushes on exit.
+
+        Returns:
+            The batch itself
+
+        """
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        """Flush the pending updates unless the block raised.
+
+        Args:
+            exc_type: Exception type, if the block raised
+            *exc_info: Remaining exception details (ignored)
+
+        """
+        if exc_type is None:
+            self.flush()
+
+
+# Many2one fields shown by display_record_detail, in display order
+_DETAIL_MANY2ONE_FIELDS = (
+    ("partner_id", "Partner"),
+    ("stage_id", "Stage"),
+    ("user_id", "Assigned To"),
+    ("project_id", "Project"),
+)
+
+
 def display_record_detail(
     record: dict[str, Any],
     model: str,  # noqa: ARG001
@@ -201,23 +590,16 @@ def display_record_detail(
     console.print(f"\n[bold cyan]{record_type} #{record['id']}[/bold cyan]")
     console.print(f"[bold]Name:[/bold] {record['name']}")
 
-    if record.get("partner_id"):
-        console.print(f"[bold]Partner:[/bold] {record['partner_id'][1]}")
-
-    if record.get("stage_id"):
-        console.print(f"[bold]Stage:[/bold] {record['stage_id'][1]}")
-
-    if record.get("user_id"):
-        console.print(f"[bold]Assigned To:[/bold] {record['user_id'][1]}")
-
-    if record.get("project_id"):
-        console.print(f"[bold]Project:[/bold] {record['project_id'][1]}")
+    for field_name, label in _DETAIL_MANY2ONE_FIELDS:
+        name = _m2o_name(record, field_name)
+        if name:
+            console.print(f"[bold]{label}:[/bold] {name}")
 
     if "priority" in record:
         console.print(f"[bold]Priority:[/bold] {record.get('priority', '0')}")
 
-    if record.get("description"):
-        description = record["description"]
+    description = record.get("description")
+    if description:
         if show_html:
             console.print(f"\n[bold]Description:[/bold]\n{description}")
         else:
@@ -225,8 +607,9 @@ def display_record_detail(
             markdown_text = _html_to_markdown(description)
             console.print(f"\n[bold]Description:[/bold]\n{markdown_text}")
 
-    if record.get("tag_ids"):
-        console.print(f"\n[bold]Tags:[/bold] {', '.join(map(str, record['tag_ids']))}")
+    tag_ids = record.get("tag_ids")
+    if tag_ids:
+        console.print(f"\n[bold]Tags:[/bold] {', '.join(map(str, tag_ids))}")
 
 
 def add_comment(
@@ -295,6 +678,72 @@ def add_note(
     )
 
 
+def add_comments(
+    client: OdooClient,
+    model: str,
+    comments: list[tuple[int, str]],
+    user_id: int | None = None,
+    markdown: bool = False,
+) -> bool:
+    """Add comments to several records (visible to customers) in one call.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        comments: (record_id, message) pairs
+        user_id: User ID to post as (uses default if None)
+        markdown: If True, convert markdown to HTML
+
+    Returns:
+        True if successful
+
+    """
+    posts = [(record_id, _convert_to_html(message, markdown)) for record_id, message in comments]
+    message_ids = messages_post_sudo(client, model, posts, user_id=user_id, is_note=False)
+    return len(message_ids) == len(posts)
+
+
+def add_notes(
+    client: OdooClient,
+    model: str,
+    notes: list[tuple[int, str]],
+    user_id: int | None = None,
+    markdown: bool = False,
+) -> bool:
+    """Add internal notes to several records (not visible to customers) in one call.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        notes: (record_id, message) pairs
+        user_id: User ID to post as (uses default if None)
+        markdown: If True, convert markdown to HTML
+
+    Returns:
+        True if successful
+
+    """
+    posts = [(record_id, _convert_to_html(message, markdown)) for record_id, message in notes]
+    message_ids = messages_post_sudo(client, model, posts, user_id=user_id, is_note=True)
+    return len(message_ids) == len(posts)
+
+
+@cache
+def _get_markdown_converter() -> "Markdown":
+    """Get the shared markdown converter.
+
+    markdown.markdown() builds a new converter and loads its extensions on every
+    call; reusing one instance (reset between documents) avoids that.
+
+    Returns:
+        Configured Markdown instance
+
+    """
+    from markdown import Markdown
+
+    return Markdown(extensions=["extra", "nl2br", "sane_lists"])
+
+
 def _convert_to_html(text: str, use_markdown: bool = False) -> str:
     """Convert text to HTML, optionally processing markdown.
 
@@ -307,14 +756,150 @@ def _convert_to_html(text: str, use_markdown: bool = False) -> str:
 
     """
     if use_markdown:
-        import markdown
+        return _get_markdown_converter().reset().convert(text)
+    # Plain text - escape it so "<" or "&" in a message cannot turn into markup, and
+    # keep its line breaks the way the markdown path does (nl2br)
+    return "<p>" + escape(text, quote=False).replace("\n", "<br>\n") + "</p>"
+
+
+class _HTMLToMarkdown(HTMLParser):
+    """Simple HTML to Markdown converter."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.result = io.StringIO()
+        self.in_bold = False
+        self.in_italic = False
+        self.in_code = False
+        self.in_pre = False
+        self.in_heading = 0
+        self.in_list_item = False
+        self.list_stack: list[str] = []  # Track ul/ol nesting
+
+    def _bold_start(self, tag: str) -> None:  # noqa: ARG002
+        self.in_bold = True
+        self.result.write("**")
+
+    def _bold_end(self, tag: str) -> None:  # noqa: ARG002
+        self.in_bold = False
+        self.result.write("**")
+
+    def _italic_start(self, tag: str) -> None:  # noqa: ARG002
+        self.in_italic = True
+        self.result.write("*")
+
+    def _italic_end(self, tag: str) -> None:  # noqa: ARG002
+        self.in_italic = False
+        self.result.write("*")
+
+    def _code_start(self, tag: str) -> None:  # noqa: ARG002
+        self.in_code = True
+        self.result.write("`")
+
+    def _code_end(self, tag: str) -> None:  # noqa: ARG002
+        self.in_code = False
+        self.result.write("`")
+
+    def _pre_start(self, tag: str) -> None:  # noqa: ARG002
+        self.in_pre = True
+        self.result.write("\n```\n")
+
+    def _pre_end(self, tag: str) -> None:  # noqa: ARG002
+        self.in_pre = False
+        self.result.write("\n```\n")
+
+    def _heading_start(self, tag: str) -> None:
+        self.in_heading = int(tag[1])
+        self.result.write("\n" + "#" * self.in_heading + " ")
+
+    def _heading_end(self, tag: str) -> None:  # noqa: ARG002
+        self.in_heading = 0
+        self.result.write("\n")
+
+    def _br(self, tag: str) -> None:  # noqa: ARG002
+        self.result.write("\n")
+
+    def _paragraph_start(self, tag: str) -> None:  # noqa: ARG002
+        self.result.write("\n\n")
+
+    def _link_start(self, tag: str) -> None:  # noqa: ARG002
+        self.result.write("[")
+
+    def _link_end(self, tag: str) -> None:  # noqa: ARG002
+        self.result.write("]")
+
+    def _list_start(self, tag: str) -> None:
+        self.list_stack.append(tag)
+        self.result.write("\n")
+
+    def _list_end(self, tag: str) -> None:  # noqa: ARG002
+        if self.list_stack:
+            self.list_stack.pop()
+        self.result.write("\n")
+
+    def _list_item_start(self, tag: str) -> None:  # noqa: ARG002
+        self.in_list_item = True
+        indent = "  " * (len(self.list_stack) - 1)
+        if self.list_stack and self.list_stack[-1] == "ul":
+            self.result.write(f"{indent}- ")
+        else:
+            self.result.write(f"{indent}1. ")
+
+    def _list_item_end(self, tag: str) -> None:  # noqa: ARG002
+        self.in_list_item = False
+        self.result.write("\n")
+
+    # Tag dispatch tables: one dict lookup per tag instead of an if/elif chain
+    _START_TAGS: ClassVar[dict[str, Callable[[Any, str], None]]] = {
+        "b": _bold_start,
+        "strong": _bold_start,
+        "i": _italic_start,
+        "em": _italic_start,
+        "code": _code_start,
+        "pre": _pre_start,
+        **dict.fromkeys(("h1", "h2", "h3", "h4", "h5", "h6"), _heading_start),
+        "br": _br,
+        "p": _paragraph_start,
+        "a": _link_start,
+        "ul": _list_start,
+        "ol": _list_start,
+        "li": _list_item_start,
+    }
+    _END_TAGS: ClassVar[dict[str, Callable[[Any, str], None]]] = {
+        "b": _bold_end,
+        "strong": _bold_end,
+        "i": _italic_end,
+        "em": _italic_end,
+        "code": _code_end,
+        "pre": _pre_end,
+        **dict.fromkeys(("h1", "h2", "h3", "h4", "h5", "h6"), _heading_end),
+        "a": _link_end,
+        "ul": _list_end,
+        "ol": _list_end,
+        "li": _list_item_end,
+    }
 
-        return markdown.markdown(
-            text,
-            extensions=["extra", "nl2br", "sane_lists"],
-        )
-    # Plain text - wrap in paragraph tags with newline support
-    return f"<p>{text}</p>"
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: list[tuple[str, str | None]],  # noqa: ARG002
+    ) -> None:
+        handler = self._START_TAGS.get(tag)
+        if handler is not None:
+            handler(self, tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        handler = self._END_TAGS.get(tag)
+        if handler is not None:
+            handler(self, tag)
+
+    def handle_data(self, data: str) -> None:
+        # isspace() answers the same question as strip() without allocating a copy
+        if self.in_pre or not data.isspace():
+            self.result.write(data)
+
+    def get_markdown(self) -> str:
+        return self.result.getvalue().strip()
 
 
 def _html_to_markdown(html: str) -> str:
@@ -327,102 +912,22 @@ def _html_to_markdown(html: str) -> str:
         Markdown-formatted text
 
     """
-    from html import unescape
-    from html.parser import HTMLParser
-
-    class HTMLToMarkdown(HTMLParser):
-        """Simple HTML to Markdown converter."""
-
-        def __init__(self) -> None:
-            super().__init__()
-            self.result: list[str] = []
-            self.in_bold = False
-            self.in_italic = False
-            self.in_code = False
-            self.in_pre = False
-            self.in_heading = 0
-            self.in_list_item = False
-            self.list_stack: list[str] = []  # Track ul/ol nesting
-
-        def handle_starttag(  # noqa: PLR0912
-            self, tag: str, attrs: list[tuple[str, str | None]]  # noqa: ARG002
-        ) -> None:
-            if tag in ("b", "strong"):
-                self.in_bold = True
-                self.result.append("**")
-            elif tag in ("i", "em"):
-                self.in_italic = True
-                self.result.append("*")
-            elif tag == "code":
-                self.in_code = True
-                self.result.append("`")
-            elif tag == "pre":
-                self.in_pre = True
-                self.result.append("\n```\n")
-            elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
-                self.in_heading = int(tag[1])
-                self.result.append("\n" + "#" * self.in_heading + " ")
-            elif tag == "br":
-                self.result.append("\n")
-            elif tag == "p":
-                self.result.append("\n\n")
-            elif tag == "a":
-                self.result.append("[")
-            elif tag == "ul":
-                self.list_stack.append("ul")
-                self.result.append("\n")
-            elif tag == "ol":
-                self.list_stack.append("ol")
-                self.result.append("\n")
-            elif tag == "li":
-                self.in_list_item = True
-                indent = "  " * (len(self.list_stack) - 1)
-                if self.list_stack and self.list_stack[-1] == "ul":
-                    self.result.append(f"{indent}- ")
-                else:
-                    self.result.append(f"{indent}1. ")
-
-        def handle_endtag(self, tag: str) -> None:
-            if tag in ("b", "strong"):
-                self.in_bold = False
-                self.result.append("**")
-            elif tag in ("i", "em"):
-                self.in_italic = False
-                self.result.append("*")
-            elif tag == "code":
-                self.in_code = False
-                self.result.append("`")
-            elif tag == "pre":
-                self.in_pre = False
-                self.result.append("\n```\n")
-            elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
-                self.in_heading = 0
-                self.result.append("\n")
-            elif tag == "a":
-                self.result.append("]")
-            elif tag in ("ul", "ol"):
-                if self.list_stack:
-                    self.list_stack.pop()
-                self.result.append("\n")
-            elif tag == "li":
-                self.in_list_item = False
-                self.result.append("\n")
-
-        def handle_data(self, data: str) -> None:
-            if data.strip() or self.in_pre:
-                self.result.append(data)
-
-        def get_markdown(self) -> str:
-            return "".join(self.result).strip()
-
-    parser = HTMLToMarkdown()
-    parser.feed(unescape(html))
+    if "<" not in html:
+        # No markup to walk, only entities to decode
+        return unescape(html).strip()
+    # HTMLParser decodes character references itself (convert_charrefs), so the
+    # input must not be unescaped first or "&lt;b&gt;" would turn into a tag.
+    parser = _HTMLToMarkdown()
+    parser.feed(html)
+    parser.close()
     return parser.get_markdown()
 
 
 def list_tags(client: OdooClient, model: str) -> list[dict[str, Any]]:
     """List available tags for a model.
 
+    Tags change rarely, so results are cached in-process for _TAGS_TTL seconds.
+
     Args:
         client: Odoo client
         model: Tag model name (e.g., 'helpdesk.tag', 'project.tags')
@@ -431,8 +936,41 @@ def list_tags(client: OdooClient, model: str) -> list[dict[str, Any]]:
         List of tag dictionaries
 
     """
+    key = (client.url, client.db, model)
+    cached = _tags_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _TAGS_TTL:
+        return cached[1]
+
     fields = ["id", "name", "color"]
-    return client.search_read(model, fields=fields, order="name")
+    tags = client.search_read(model, fields=fields, order="name")
+    _tags_cache[key] = (now, tags)
+    return tags
+
+
+def get_tag_id_by_name(client: OdooClient, model: str, name: str) -> int | None:
+    """Find a tag ID by its name.
+
+    Uses the cached list_tags() result; an exact match wins over a
+    case-insensitive one.
+
+    Args:
+        client: Odoo client
+        model: Tag model name (e.g., 'helpdesk.tag', 'project.tags')
+        name: Tag name
+
+    Returns:
+        Tag ID, or None if no tag has that name
+
+    """
+    folded_match = None
+    folded_name = name.casefold()
+    for tag in list_tags(client, model):
+        if tag["name"] == name:
+            return int(tag["id"])
+        if folded_match is None and tag["name"].casefold() == folded_name:
+            folded_match = int(tag["id"])
+    return folded_match
 
 
 def display_tags(tags: list[dict[str, Any]], title: str = "Tags") -> None:
@@ -443,22 +981,65 @@ def display_tags(tags: list[dict[str, Any]], title: str = "Tags") -> None:
         title: Table title
 
     """
+    from rich.table import Table
+
     console = _get_console()
     table = Table(title=title)
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="green")
     table.add_column("Color", style="yellow")
 
-    for tag in tags:
-        table.add_row(
-            str(tag["id"]),
-            tag["name"],
-            str(tag.get("color", "N/A")),
-        )
+    rows = [(str(tag["id"]), tag["name"], str(tag.get("color", "N/A"))) for tag in tags]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
 
+def get_record_attachments_tags(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    tag_model: str,
+    fields: list[str] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch a record, its attachments and the available tags in one round trip.
+
+    The three reads are sent concurrently through client.batch(); the tags also
+    refresh the list_tags() cache. See aget_record_messages_attachments() for the
+    record's messages instead of the tags.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        tag_model: Tag model name (e.g., 'helpdesk.tag')
+        fields: List of field names to read on the record (None = all fields)
+
+    Returns:
+        Tuple of (record, attachments, tags)
+
+    Raises:
+        ValueError: If record not found
+
+    """
+    read_args: list[Any] = [[record_id]] if fields is None else [[record_id], fields]
+    attachment_domain = _attachment_domain(model, record_id)
+    records, attachments, tags = client.batch(
+        [
+            (model, "read", read_args, {}),
+            ("ir.attachment", "search_read", [attachment_domain], {"fields": _ATTACHMENT_FIELDS}),
+            (tag_model, "search_read", [[]], {"fields": ["id", "name", "color"], "order": "name"}),
+        ]
+    )
+    if not records:
+        msg = f"Record {record_id} not found in {model}"
+        raise ValueError(msg)
+    _tags_cache[(client.url, client.db, tag_model)] = (time.monotonic(), tags)
+    return records[0], attachments, tags
+
+
 def add_tag_to_record(
     client: OdooClient,
     model: str,
@@ -477,20 +1058,72 @@ def add_tag_to_record(
         True if successful
 
     """
-    # Get current tags
-    record = get_record(client, model, record_id)
-    current_tags = record.get("tag_ids", [])
+    # (4, id, 0) links the tag without touching the others, so no read is needed
+    # and concurrent tag additions cannot overwrite each other. Linking a tag
+    # that is already present is a no-op on the server.
+    return client.write(model, [record_id], {"tag_ids": [(4, tag_id, 0)]})
 
-    # Add new tag if not already present
-    if tag_id not in current_tags:
-        current_tags.append(tag_id)
-        return client.write(
-            model,
-            [record_id],
-            {"tag_ids": [(6, 0, current_tags)]},
-        )
 
-    return True
+def add_tags_to_records(
+    client: OdooClient,
+    model: str,
+    pairs: list[tuple[int, int]],
+    max_workers: int = 8,
+) -> bool:
+    """Add tags to several records with as few writes as possible.
+
+    Records that receive the same set of tags are updated by one write, so
+    tagging N records with the same tag costs a single round trip; writes for
+    different tag sets are sent concurrently through client.batch().
+
+    Args:
+        client: Odoo client
+        model: Model name
+        pairs: (record_id, tag_id) pairs
+        max_workers: Maximum number of writes in flight at once
+
+    Returns:
+        True if all writes succeeded
+
+    """
+    tags_by_record: dict[int, set[int]] = {}
+    for record_id, tag_id in pairs:
+        tags_by_record.setdefault(record_id, set()).add(tag_id)
+
+    records_by_tags: dict[frozenset[int], list[int]] = {}
+    for record_id, tag_ids in tags_by_record.items():
+        records_by_tags.setdefault(frozenset(tag_ids), []).append(record_id)
+
+    operations: list[tuple[str, str, list[Any], dict[str, Any]]] = []
+    for tag_set, record_ids in records_by_tags.items():
+        commands = [(4, tag_id, 0) for tag_id in sorted(tag_set)]
+        operations.append((model, "write", [record_ids, {"tag_ids": commands}], {}))
+    return all(client.batch(operations, max_workers=max_workers))
+
+
+def _message_domain(
+    model: str,
+    record_id: int,
+    message_types: list[str] | None = None,
+) -> list[Any]:
+    """Build the mail.message domain for a record's chatter.
+
+    Args:
+        model: Model name
+        record_id: Record ID
+        message_types: Only match these message types (None = all)
+
+    Returns:
+        Search domain
+
+    """
+    domain: list[Any] = [
+        ("model", "=", model),
+        ("res_id", "=", record_id),
+    ]
+    if message_types:
+        domain.append(("message_type", "in", message_types))
+    return domain
 
 
 def list_messages(
@@ -498,6 +1131,9 @@ def list_messages(
     model: str,
     record_id: int,
     limit: int | None = None,
+    *,
+    fields: list[str] | None = None,
+    message_types: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """List messages/chatter for a record.
 
@@ -506,25 +1142,17 @@ def list_messages(
         model: Model name
         record_id: Record ID
         limit: Maximum number of messages (None = all)
+        fields: List of fields to fetch (None = fields used by display_messages)
+        message_types: Only list these message types, e.g. ['comment', 'email']
+            (None = all, including notifications)
 
     Returns:
         List of message dictionaries
 
     """
-    domain = [
-        ("model", "=", model),
-        ("res_id", "=", record_id),
-    ]
-    fields = [
-        "id",
-        "date",
-        "author_id",
-        "body",
-        "subject",
-        "message_type",
-        "subtype_id",
-        "email_from",
-    ]
+    domain = _message_domain(model, record_id, message_types)
+    if fields is None:
+        fields = _MESSAGE_FIELDS
 
     return client.search_read(
         "mail.message",
@@ -535,49 +1163,106 @@ def list_messages(
     )
 
 
-def display_messages(messages: list[dict[str, Any]], show_html: bool = False) -> None:
-    """Display messages in a formatted list.
+def iter_messages(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    *,
+    batch_size: int = 200,
+    fields: list[str] | None = None,
+    message_types: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over all messages of a record, fetching them page by page.
+
+    Unlike list_messages with no limit, at most one page of messages is held in
+    memory at a time.
 
     Args:
-        messages: List of message dictionaries
-        show_html: Whether to show raw HTML body
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        batch_size: Number of messages fetched per request
+        fields: List of fields to fetch (None = fields used by display_messages)
+        message_types: Only yield these message types (None = all)
+
+    Yields:
+        Message dictionaries, newest first
 
     """
-    from html import unescape
-    from html.parser import HTMLParser
+    domain = _message_domain(model, record_id, message_types)
+    if fields is None:
+        fields = _MESSAGE_FIELDS
+
+    offset = 0
+    while True:
+        page = client.search_read(
+            "mail.message",
+            domain=domain,
+            fields=fields,
+            order="date desc, id desc",
+            limit=batch_size,
+            offset=offset,
+        )
+        yield from page
+        if len(page) < batch_size:
+            return
+        offset += batch_size
 
-    console = _get_console()
 
-    class HTMLToText(HTMLParser):
-        """Simple HTML to text converter."""
+def _html_to_text(html: str) -> str:
+    """Convert HTML to plain text by dropping markup and decoding entities.
 
-        def __init__(self) -> None:
-            super().__init__()
-            self.text: list[str] = []
+    A single C-level regex substitution; much cheaper than driving HTMLParser
+    over every message body.
 
-        def handle_data(self, data: str) -> None:
-            self.text.append(data)
+    Args:
+        html: HTML string
 
-        def get_text(self) -> str:
-            return "".join(self.text).strip()
+    Returns:
+        Plain text, stripped
 
-    if not messages:
-        console.print("[yellow]No messages found[/yellow]")
-        return
+    """
+    if "<" not in html and "&" not in html:
+        return html.strip()
+    return unescape(_HTML_MARKUP_RE.sub("", html)).strip()
+
+
+# Printed between messages by display_messages
+_MESSAGE_SEPARATOR = "[dim]" + "─" * 80 + "[/dim]\n"
+
+
+def display_messages(
+    messages: Iterable[dict[str, Any]],
+    show_html: bool = False,
+    empty_message: str = "No messages found",
+) -> None:
+    """Display messages in a formatted list.
 
-    console.print(f"\n[bold cyan]Message History ({len(messages)} messages)[/bold cyan]\n")
+    Messages are printed as they are consumed, so passing the iter_messages()
+    generator renders the first page while later pages are still being fetched.
 
+    Args:
+        messages: List or iterable of message dictionaries
+        show_html: Whether to show raw HTML body
+        empty_message: Text shown when there are no messages
+
+    """
+    console = _get_console()
+    count = len(messages) if isinstance(messages, Sized) else None
+
+    m2o = _m2o_name
+    i = 0
     for i, msg in enumerate(messages, 1):
+        if i == 1:
+            title = "Message History" if count is None else f"Message History ({count} messages)"
+            console.print(f"\n[bold cyan]{title}[/bold cyan]\n")
+        else:
+            console.print(_MESSAGE_SEPARATOR)
+
         # Message header
         date = msg.get("date", "N/A")
-        author = msg.get("author_id")
-        author_name = (
-            author[1] if author and isinstance(author, list) else msg.get("email_from", "Unknown")
-        )
-
-        message_type = msg.get("message_type", "comment")
-        subtype = msg.get("subtype_id")
-        subtype_name = subtype[1] if subtype and isinstance(subtype, list) else message_type
+        author_name = m2o(msg, "author_id") or msg.get("email_from", "Unknown")
+        subtype_name = m2o(msg, "subtype_id") or msg.get("message_type", "comment")
 
         console.print(f"[bold]Message #{i}[/bold] [dim]({date})[/dim]")
         console.print(f"[cyan]From:[/cyan] {author_name}")
@@ -592,21 +1277,42 @@ def display_messages(messages: list[dict[str, Any]], show_html: bool = False) ->
             if show_html:
                 console.print(f"\n{body}\n")
             else:
-                # Convert HTML to plain text
-                parser = HTMLToText()
-                parser.feed(unescape(body))
-                text = parser.get_text()
+                text = _html_to_text(body)
                 if text:
                     console.print(f"\n{text}\n")
 
-        if i < len(messages):
-            console.print("[dim]" + "─" * 80 + "[/dim]\n")
+    if i == 0:
+        console.print(f"[yellow]{empty_message}[/yellow]")
+
+
+def _attachment_domain(model: str, record_id: int, extension: str | None = None) -> list[Any]:
+    """Build the ir.attachment domain for a record's attachments.
+
+    Args:
+        model: Model name
+        record_id: Record ID
+        extension: Only match file names with this extension (case-insensitive)
+
+    Returns:
+        Search domain
+
+    """
+    domain: list[Any] = [
+        ("res_model", "=", model),
+        ("res_id", "=", record_id),
+    ]
+    if extension:
+        ext = extension.lower().lstrip(".").replace("%", r"\%").replace("_", r"\_")
+        domain.append(("name", "=ilike", f"%.{ext}"))
+    return domain
 
 
 def list_attachments(
     client: OdooClient,
     model: str,
     record_id: int,
+    fields: list[str] | None = None,
+    extension: str | None = None,
 ) -> list[dict[str, Any]]:
     """List attachments for a record.
 
@@ -614,16 +1320,16 @@ def list_attachments(
         client: Odoo client
         model: Model name
         record_id: Record ID
+        fields: List of fields to fetch (None = fields used by display_attachments)
+        extension: Only list files with this extension (e.g., 'pdf'); filtered server-side
 
     Returns:
         List of attachment dictionaries
 
     """
-    domain = [
-        ("res_model", "=", model),
-        ("res_id", "=", record_id),
-    ]
-    fields = ["id", "name", "file_size", "mimetype", "create_date"]
+    domain = _attachment_domain(model, record_id, extension)
+    if fields is None:
+        fields = _ATTACHMENT_FIELDS
 
     return client.search_read("ir.attachment", domain=domain, fields=fields)
 
@@ -635,6 +1341,8 @@ def display_attachments(attachments: list[dict[str, Any]]) -> None:
         attachments: List of attachment dictionaries
 
     """
+    from rich.table import Table
+
     console = _get_console()
     table = Table(title="Attachments")
     table.add_column("ID", style="cyan")
@@ -643,17 +1351,19 @@ def display_attachments(attachments: list[dict[str, Any]]) -> None:
     table.add_column("Type", style="blue")
     table.add_column("Created", style="magenta")
 
-    for att in attachments:
-        size = att.get("file_size", 0)
-        size_str = f"{size / 1024:.1f} KB" if size else "N/A"
-
-        table.add_row(
+    rows = [
+        (
             str(att["id"]),
             att.get("name", "N/A"),
-            size_str,
+            f"{size / 1024:.1f} KB" if (size := att.get("file_size", 0)) else "N/A",
             att.get("mimetype", "N/A"),
             str(att.get("create_date", "N/A")),
         )
+        for att in attachments
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
@@ -677,7 +1387,11 @@ def download_attachment(
         ValueError: If attachment not found
 
     """
-    attachments = client.read("ir.attachment", [attachment_id], ["name", "datas"])
+    # Stream the raw file over HTTP when possible, else decode the base64 datas
+    # field, which is then read together with the name
+    stream = client.can_download_content()
+    fields = ["name"] if stream else ["name", "datas"]
+    attachments = client.read("ir.attachment", [attachment_id], fields)
 
     if not attachments:
         msg = f"Attachment {attachment_id} not found"
@@ -691,10 +1405,17 @@ def download_attachment(
     elif output_path.is_dir():
         output_path = output_path / filename
 
-    # Decode base64 data and write to file
+    if stream:
+        if client.download_content(attachment_id, output_path):
+            return output_path
+        attachments = client.read("ir.attachment", [attachment_id], ["datas"])
+        if not attachments:
+            msg = f"Attachment {attachment_id} not found"
+            raise ValueError(msg)
+        attachment = attachments[0]
+
     if attachment.get("datas"):
-        data = base64.b64decode(attachment["datas"])
-        output_path.write_bytes(data)
+        _write_base64(output_path, attachment["datas"])
     else:
         msg = f"Attachment {attachment_id} has no data"
         raise ValueError(msg)
@@ -708,6 +1429,9 @@ def download_record_attachments(
     record_id: int,
     output_dir: Path | None = None,
     extension: str | None = None,
+    *,
+    max_workers: int = DOWNLOAD_WORKERS,
+    attachments: list[dict[str, Any]] | None = None,
 ) -> list[Path]:
     """Download all attachments for a record.
 
@@ -717,6 +1441,9 @@ def download_record_attachments(
         record_id: Record ID
         output_dir: Output directory (defaults to current directory)
         extension: File extension filter (e.g., 'pdf', 'jpg')
+        max_workers: Number of files decoded and written in parallel
+        attachments: Attachment records already fetched with 'name' and 'datas'
+            (e.g. by list_attachments); skips fetching them again
 
     Returns:
         List of paths to downloaded files
@@ -727,37 +1454,33 @@ def download_record_attachments(
     elif not output_dir.exists():
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    attachments = list_attachments(client, model, record_id)
-
-    # Filter by extension if provided
-    if extension:
-        ext = extension.lower().lstrip(".")
-        attachments = [
-            att for att in attachments if att.get("name", "").lower().endswith(f".{ext}")
-        ]
+    # The extension filter runs server-side, so names and data come back in one call
+    records = attachments
+    if records is None:
+        records = list_attachments(
+            client, model, record_id, fields=["name", "datas"], extension=extension
+        )
 
     downloaded_files = []
     console = _get_console()
 
-    for attachment in attachments:
-        try:
-            # Read the full attachment with data
-            att_data = client.read("ir.attachment", [attachment["id"]], ["name", "datas"])
-            if not att_data:
-                continue
-
-            att = att_data[0]
-            filename = att.get("name", f"attachment_{attachment['id']}")
-            output_path = output_dir / filename
-
-            # Decode base64 data and write to file
+    # Decode and write the files in parallel; file I/O releases the GIL
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for att in records:
             if att.get("datas"):
-                data = base64.b64decode(att["datas"])
-                output_path.write_bytes(data)
-                downloaded_files.append(output_path)
+                filename = att.get("name") or f"attachment_{att['id']}"
+                output_path = output_dir / filename
+                future = executor.submit(_write_base64, output_path, att["datas"])
+                futures.append((filename, output_path, future))
+
+    for filename, output_path, future in futures:
+        try:
+            future.result()
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to download {filename}: {e}[/yellow]")
             continue
+        downloaded_files.append(output_path)
 
     return downloaded_files
 
@@ -792,17 +1515,16 @@ def create_attachment(
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        msg = f"File not found: {file_path}"
-        raise FileNotFoundError(msg)
-
+    # One stat for the common case; exists() only runs to pick the error
     if not file_path.is_file():
+        if not file_path.exists():
+            msg = f"File not found: {file_path}"
+            raise FileNotFoundError(msg)
         msg = f"Path is not a file: {file_path}"
         raise ValueError(msg)
 
     # Read file and encode to base64
-    file_data = file_path.read_bytes()
-    encoded_data = base64.b64encode(file_data).decode("utf-8")
+    encoded_data = _read_base64(file_path)
 
     # Use provided name or file name
     attachment_name = name or file_path.name
@@ -838,11 +1560,155 @@ def get_record_url(client: OdooClient, model: str, record_id: int) -> str:
     return f"{base_url}/web#id={record_id}&model={model}&view_type=form"
 
 
+async def aget_record(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Async variant of get_record.
+
+    The blocking XML-RPC call runs in a worker thread, so several calls can be
+    awaited concurrently with asyncio.gather().
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Record dictionary
+
+    """
+    return await asyncio.to_thread(get_record, client, model, record_id, fields)
+
+
+async def alist_messages(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    limit: int | None = None,
+    fields: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Async variant of list_messages.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        limit: Maximum number of messages (None = all)
+        fields: List of fields to fetch (None = fields used by display_messages)
+
+    Returns:
+        List of message dictionaries
+
+    """
+    return await asyncio.to_thread(list_messages, client, model, record_id, limit, fields=fields)
+
+
+async def alist_attachments(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    fields: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Async variant of list_attachments.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        fields: List of fields to fetch (None = fields used by display_attachments)
+
+    Returns:
+        List of attachment dictionaries
+
+    """
+    return await asyncio.to_thread(list_attachments, client, model, record_id, fields)
+
+
+async def alist_tags(client: OdooClient, model: str) -> list[dict[str, Any]]:
+    """Async variant of list_tags.
+
+    Args:
+        client: Odoo client
+        model: Tag model name
+
+    Returns:
+        List of tag dictionaries
+
+    """
+    return await asyncio.to_thread(list_tags, client, model)
+
+
+async def aadd_tags_to_records(
+    client: OdooClient,
+    model: str,
+    pairs: list[tuple[int, int]],
+    max_workers: int = 8,
+) -> bool:
+    """Async version of add_tags_to_records().
+
+    Args:
+        client: Odoo client
+        model: Model name
+        pairs: (record_id, tag_id) pairs
+        max_workers: Maximum number of writes in flight at once
+
+    Returns:
+        True if all writes succeeded
+
+    """
+    return await asyncio.to_thread(add_tags_to_records, client, model, pairs, max_workers)
+
+
+async def aget_record_messages_attachments(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    fields: list[str] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch a record together with its messages and attachments concurrently.
+
+    The three reads are independent, so the wall time is roughly one round trip
+    instead of three.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        fields: List of field names to read on the record (None = all fields)
+
+    Returns:
+        Tuple of (record, messages, attachments)
+
+    """
+    # Authenticate once up front instead of racing three logins from the workers
+    await asyncio.to_thread(getattr, client, "uid")
+    record, messages, attachments = await asyncio.gather(
+        aget_record(client, model, record_id, fields),
+        alist_messages(client, model, record_id),
+        alist_attachments(client, model, record_id),
+    )
+    return record, messages, attachments
+
+
+# Converters for the non-JSON kinds recognised by _VALUE_RE
+_VALUE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "float": float,
+    "bool": lambda value: value.lower() == "true",
+    "quoted": lambda value: value[1:-1],
+}
+
+
 def parse_field_assignment(
     client: OdooClient,
     model: str,
     record_id: int,
     field_assignment: str,
+    current_record: dict[str, Any] | None = None,
 ) -> tuple[str, Any]:
     """Parse a field assignment and return field name and computed value.
 
@@ -853,6 +1719,9 @@ def parse_field_assignment(
         model: Model name
         record_id: Record ID
         field_assignment: Field assignment string (e.g., 'field=value', 'field+=5')
+        current_record: Already fetched record values (e.g., from
+            get_assignment_record) used for arithmetic operators; the field is
+            read from Odoo if it is missing here
 
     Returns:
         Tuple of (field_name, value)
@@ -867,50 +1736,39 @@ def parse_field_assignment(
         ('priority', 3)  # if current priority is 2
 
     """
-    import contextlib
-    import json
-    import re
-
     # Match assignment operators: =, +=, -=, *=, /=
-    match = re.match(r"^([^=+\-*/]+)([\+\-*/]?=)(.+)$", field_assignment)
+    match = _FIELD_ASSIGN_RE.match(field_assignment)
     if not match:
         msg = f"Invalid format '{field_assignment}'. Use field=value or field+=value"
         raise ValueError(msg)
 
-    field = match.group(1).strip()
-    operator = match.group(2).strip()
-    value = match.group(3).strip()
+    # strip() returns the string itself when there is nothing to trim; the
+    # operator group never contains whitespace
+    field, operator, value = match.groups()
+    field = field.strip()
+    value = value.strip()
 
-    # Parse the value
+    # Parse the value: JSON, integer, float, boolean or string (quotes removed)
     parsed_value: Any = value
-
-    # Check for JSON prefix
-    if value.startswith("json:"):
+    value_match = _VALUE_RE.match(value)
+    kind = value_match.lastgroup if value_match else None
+    if kind == "json":
         try:
             parsed_value = json.loads(value[5:])
         except json.JSONDecodeError as e:
             msg = f"Invalid JSON for field '{field}': {e}"
             raise ValueError(msg) from e
-    # Try to parse as integer
-    elif value.isdigit() or (value.startswith("-") and value[1:].isdigit()):
-        parsed_value = int(value)
-    # Try to parse as float
-    elif value.replace(".", "", 1).replace("-", "", 1).isdigit():
-        with contextlib.suppress(ValueError):
-            parsed_value = float(value)
-    # Try to parse as boolean
-    elif value.lower() in ("true", "false"):
-        parsed_value = value.lower() == "true"
-    # Keep as string otherwise (remove surrounding quotes if present)
-    elif (value.startswith('"') and value.endswith('"')) or (
-        value.startswith("'") and value.endswith("'")
-    ):
-        parsed_value = value[1:-1]
+    elif kind is not None:
+        parsed_value = _VALUE_PARSERS[kind](value)
 
     # Handle operators that require current value
     if operator in ("+=", "-=", "*=", "/="):
         # Get current value
-        record = get_record(client, model, record_id, fields=[field])
+        record = (
+            current_record
+            if current_record is not None and field in current_record
+            else get_record(client, model, record_id, fields=[field])
+        )
         current_value = record.get(field)
 
         if current_value is None:
@@ -940,3 +1798,72 @@ def parse_field_assignment(
             parsed_value = current_value / parsed_value
 
     return field, parsed_value
+
+
+def get_assignment_record(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    field_assignments: list[str],
+) -> dict[str, Any]:
+    """Fetch the current values needed by arithmetic field assignments.
+
+    Reads every field used with +=, -=, *= or /= in a single call, so the result
+    can be passed to parse_field_assignment() as current_record instead of
+    reading the record once per assignment.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        field_assignments: Field assignment strings (e.g., ['priority+=1', 'name=X'])
+
+    Returns:
+        Record dictionary with the referenced fields (empty if none are needed)
+
+    """
+    fields = []
+    for field_assignment in field_assignments:
+        match = _FIELD_ASSIGN_RE.match(field_assignment)
+        if match and match.group(2) != "=":
+            field = match.group(1).strip()
+            if field not in fields:
+                fields.append(field)
+    if not fields:
+        return {}
+    return get_record(client, model, record_id, fields=fields)
+
+
+def parse_field_assignments(
+    client: OdooClient,
+    model: str,
+    record_id: int,
+    field_assignments: list[str],
+) -> dict[str, Any]:
+    """Parse several field assignments into a values dictionary.
+
+    Current values needed by arithmetic operators are read in one call via
+    get_assignment_record() before the assignments are parsed.
+
+    Args:
+        client: Odoo client
+        model: Model name
+        record_id: Record ID
+        field_assignments: Field assignment strings (e.g., ['priority+=1', 'name=X'])
+
+    Returns:
+        Dictionary of field names and values, ready for set_record_fields()
+
+    Raises:
+        ValueError: If an assignment format is invalid
+
+    Examples:
+        >>> parse_field_assignments(client, "project.task", 42, ["name=X", "priority+=1"])
+        {'name': 'X', 'priority': 3}
+
+    """
+    current_record = get_assignment_record(client, model, record_id, field_assignments)
+    return dict(
+        parse_field_assignment(client, model, record_id, field_assignment, current_record)
+        for field_assignment in field_assignments
+    )
@@ -1,9 +1,38 @@
 """Odoo XML-RPC client wrapper."""
 
+import hashlib
+import http.client
+import http.cookiejar
+import json
+import os
+import shutil
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
 import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
-from odoo_ninja.config import OdooConfig
+from odoo_ninja.config import OdooConfig, get_cache_dir
+
+# Fault code Odoo's XML-RPC layer uses for AccessDenied
+_ACCESS_DENIED_FAULT = 3
+
+# Buffer size for streaming /web/content downloads to disk
+_DOWNLOAD_CHUNK = 64 * 1024
+
+# Closing tags of a marshalled XML-RPC call, split off cached execute_kw prefixes
+_XMLRPC_PARAMS_END = "</params>\n"
+_XMLRPC_CALL_END = "</methodCall>\n"
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Turn redirects into errors (Odoo redirects to /web/login when not logged in)."""
+
+    def redirect_request(self, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
+        return None
 
 
 class OdooClient:
@@ -22,17 +51,123 @@ class OdooClient:
         self.username = config.username
         self.password = config.password
 
-        # XML-RPC endpoints
-        self.common = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common")
-        self.models = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object")
+        # XML-RPC proxies are created lazily per thread (see _proxies), since an
+        # xmlrpc.client transport holds a single connection and is not thread-safe.
+        self._local = threading.local()
 
         # Authenticate and get uid
         self._uid: int | None = None
+        self._uid_from_cache = False
+
+        url_parts = urllib.parse.urlsplit(self.url)
+        self._host = url_parts.netloc
+        self._xmlrpc_path = f"{url_parts.path}/xmlrpc/2"
+        self._jsonrpc_path = f"{url_parts.path}/jsonrpc"
+        # Marshalled (db, uid, password, model, method) heads of execute_kw calls
+        self._execute_kw_prefixes: dict[tuple[int, str, str], str] = {}
+
+        # Web session used for /web/content downloads (see download_content)
+        self._web_opener: urllib.request.OpenerDirector | None = None
+        self._web_login_failed = False
+
+    def _transport(self) -> xmlrpc.client.Transport:
+        """Get the XML-RPC transport for the current thread.
+
+        The transport keeps its HTTP(S) connection open, so the authenticate
+        call and every model call after it reuse a single TCP/TLS session.
+
+        Returns:
+            Transport for this thread
+
+        """
+        transport: xmlrpc.client.Transport | None = getattr(self._local, "transport", None)
+        if transport is None:
+            transport_cls = (
+                xmlrpc.client.SafeTransport
+                if self.url.startswith("https://")
+                else xmlrpc.client.Transport
+            )
+            transport = transport_cls()
+            self._local.transport = transport
+        return transport
+
+    def _proxies(self) -> tuple[xmlrpc.client.ServerProxy, xmlrpc.client.ServerProxy]:
+        """Get the XML-RPC proxies for the current thread.
+
+        Both proxies share the thread's transport (see _transport).
+
+        Returns:
+            Tuple of (common, models) proxies
+
+        """
+        proxies: tuple[xmlrpc.client.ServerProxy, xmlrpc.client.ServerProxy] | None = getattr(
+            self._local, "proxies", None
+        )
+        if proxies is None:
+            transport = self._transport()
+            proxies = (
+                xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common", transport=transport),
+                xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object", transport=transport),
+            )
+            self._local.proxies = proxies
+        return proxies
+
+    @property
+    def common(self) -> xmlrpc.client.ServerProxy:
+        """Get the XML-RPC proxy for the common service.
+
+        Returns:
+            ServerProxy for /xmlrpc/2/common
+
+        """
+        return self._proxies()[0]
+
+    @property
+    def models(self) -> xmlrpc.client.ServerProxy:
+        """Get the XML-RPC proxy for the object service.
+
+        Returns:
+            ServerProxy for /xmlrpc/2/object
+
+        """
+        return self._proxies()[1]
+
+    def close(self) -> None:
+        """Close the kept-alive connection of the current thread."""
+        # Both reconnect on their own if the client is used again afterwards
+        transport = getattr(self._local, "transport", None)
+        if transport is not None:
+            transport.close()
+        connection = getattr(self._local, "jsonrpc_connection", None)
+        if connection is not None:
+            connection.close()
+
+    def __enter__(self) -> "OdooClient":
+        """Use the client as a context manager that closes its connection on exit.
+
+        Returns:
+            The client itself
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection when leaving the context.
+
+        Args:
+            *exc_info: Exception details, if any (ignored)
+
+        """
+        self.close()
 
     @property
     def uid(self) -> int:
         """Get authenticated user ID.
 
+        The uid is cached on disk between runs, so most CLI invocations skip the
+        authenticate round trip. A stale cached uid is detected on the first
+        rejected call and replaced (see _execute_kw).
+
         Returns:
             User ID
 
@@ -41,13 +176,357 @@ class OdooClient:
 
         """
         if self._uid is None:
-            result = self.common.authenticate(self.db, self.username, self.password, {})
+            cached_uid = self._load_cached_uid()
+            if cached_uid is not None:
+                self._uid = cached_uid
+                self._uid_from_cache = True
+                return cached_uid
+
+            result = self._call("common", "authenticate", self.db, self.username, self.password, {})
             if not isinstance(result, int) or result <= 0:
                 msg = "Authentication failed"
                 raise RuntimeError(msg)
             self._uid = result
+            self._store_cached_uid(result)
         return self._uid
 
+    def _uid_cache_key(self) -> str:
+        """Get the uid cache key for this server, database and user.
+
+        Returns:
+            Hex digest identifying the login
+
+        """
+        login = "\0".join((self.url, self.db, self.username))
+        return hashlib.sha256(login.encode()).hexdigest()
+
+    def _load_cached_uid(self) -> int | None:
+        """Read this login's uid from the on-disk cache.
+
+        Returns:
+            Cached user ID, or None if not cached
+
+        """
+        try:
+            cache = json.loads((get_cache_dir() / "uid.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        uid = cache.get(self._uid_cache_key()) if isinstance(cache, dict) else None
+        return uid if isinstance(uid, int) and uid > 0 else None
+
+    def _store_cached_uid(self, uid: int | None) -> None:
+        """Write (or with None, remove) this login's uid in the on-disk cache.
+
+        The file is replaced atomically; failures are ignored since the cache is
+        only an optimization.
+
+        Args:
+            uid: User ID to store, or None to forget it
+
+        """
+        cache_dir = get_cache_dir()
+        cache_file = cache_dir / "uid.json"
+        try:
+            cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+
+        if uid is None:
+            if cache.pop(self._uid_cache_key(), None) is None:
+                return
+        else:
+            cache[self._uid_cache_key()] = uid
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(cache), encoding="utf-8")
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass
+
+    def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Call execute_kw on the object service.
+
+        If the call is rejected while using a uid from the on-disk cache, the
+        cached uid is dropped and the call is retried once after authenticating.
+
+        Args:
+            model: Odoo model name
+            method: Method name
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+
+        Returns:
+            Method result
+
+        """
+        try:
+            return self._object_call(model, method, args, kwargs)
+        except xmlrpc.client.Fault as e:
+            if not self._uid_from_cache or e.faultCode != _ACCESS_DENIED_FAULT:
+                raise
+            self._store_cached_uid(None)
+            self._uid = None
+            self._uid_from_cache = False
+            return self._object_call(model, method, args, kwargs)
+
+    def _object_call(
+        self,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Send one execute_kw call to the object service.
+
+        Over XML-RPC the fixed head of the call (credentials, model and method)
+        is marshalled once per (uid, model, method) and reused, so only args and
+        kwargs are marshalled on each call.
+
+        Args:
+            model: Odoo model name
+            method: Method name
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+
+        Returns:
+            Method result
+
+        """
+        uid = self.uid
+        if self.config.jsonrpc:
+            return self._jsonrpc(
+                "object",
+                "execute_kw",
+                [self.db, uid, self.password, model, method, args, kwargs],
+            )
+
+        key = (uid, model, method)
+        prefix = self._execute_kw_prefixes.get(key)
+        if prefix is None:
+            head = xmlrpc.client.dumps((self.db, uid, self.password, model, method), "execute_kw")
+            prefix = head.removesuffix(_XMLRPC_PARAMS_END + _XMLRPC_CALL_END)
+            self._execute_kw_prefixes[key] = prefix
+        tail = xmlrpc.client.Marshaller().dumps((args, kwargs)).removeprefix("<params>\n")
+        request = (prefix + tail + _XMLRPC_CALL_END).encode("utf-8", "xmlcharrefreplace")
+        response = self._transport().request(self._host, f"{self._xmlrpc_path}/object", request)
+        return response[0] if len(response) == 1 else response
+
+    def _call(self, service: str, method: str, *args: Any) -> Any:
+        """Call a method of an Odoo RPC service over the configured protocol.
+
+        Args:
+            service: Service name ('common' or 'object')
+            method: Method name (e.g., 'authenticate', 'execute_kw')
+            *args: Method arguments
+
+        Returns:
+            Method result
+
+        """
+        if self.config.jsonrpc:
+            return self._jsonrpc(service, method, list(args))
+        return self._xmlrpc(service, method, args)
+
+    def _xmlrpc(self, service: str, method: str, args: tuple[Any, ...]) -> Any:
+        """Call a method of an Odoo RPC service over XML-RPC.
+
+        Marshals the call and hands it straight to the transport, which is what
+        ServerProxy does internally minus its per-call attribute dispatch.
+
+        Args:
+            service: Service name ('common' or 'object')
+            method: Method name
+            args: Method arguments
+
+        Returns:
+            Method result
+
+        """
+        request = xmlrpc.client.dumps(args, method).encode("utf-8", "xmlcharrefreplace")
+        response = self._transport().request(self._host, f"{self._xmlrpc_path}/{service}", request)
+        return response[0] if len(response) == 1 else response
+
+    def _jsonrpc(self, service: str, method: str, args: list[Any]) -> Any:
+        """Call a method of an Odoo RPC service over JSON-RPC.
+
+        Uses a kept-alive connection per thread. JSON decoding runs in C, which
+        is much cheaper than xmlrpc.client's per-element unmarshalling on large
+        search_read results.
+
+        Args:
+            service: Service name ('common' or 'object')
+            method: Method name
+            args: Method arguments
+
+        Returns:
+            Method result
+
+        Raises:
+            xmlrpc.client.Fault: If Odoo returns an error, so callers handle both
+                protocols the same way
+            RuntimeError: If the server does not answer with JSON-RPC
+
+        """
+        body = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": service, "method": method, "args": args},
+                "id": None,
+            }
+        ).encode()
+        headers = {"Content-Type": "application/json"}
+
+        connection = self._jsonrpc_connection()
+        # An open socket here means the connection already served a request
+        reused = connection.sock is not None
+        try:
+            connection.request("POST", self._jsonrpc_path, body, headers)
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            # The server dropped the idle keep-alive connection before answering, so the
+            # call never ran; resend once on a fresh connection, like xmlrpc.client does
+            connection.close()
+            if not reused:
+                raise
+            connection.request("POST", self._jsonrpc_path, body, headers)
+            response = connection.getresponse()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise
+        data = response.read()
+
+        try:
+            reply = json.loads(data)
+        except ValueError as e:
+            msg = f"Invalid JSON-RPC response (HTTP {response.status})"
+            raise RuntimeError(msg) from e
+
+        error = reply.get("error")
+        if error:
+            details = error.get("data") or {}
+            code = (
+                _ACCESS_DENIED_FAULT
+                if details.get("name") == "odoo.exceptions.AccessDenied"
+                else error.get("code", 1)
+            )
+            raise xmlrpc.client.Fault(code, details.get("message") or error.get("message", ""))
+        return reply.get("result")
+
+    def _jsonrpc_connection(self) -> http.client.HTTPConnection:
+        """Get the kept-alive JSON-RPC connection for the current thread.
+
+        Returns:
+            HTTP(S) connection to the Odoo server
+
+        """
+        connection: http.client.HTTPConnection | None = getattr(
+            self._local, "jsonrpc_connection", None
+        )
+        if connection is None:
+            parts = urllib.parse.urlsplit(self.url)
+            connection_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_cls(parts.netloc)
+            self._local.jsonrpc_connection = connection
+        return connection
+
+    def _get_web_opener(self) -> urllib.request.OpenerDirector | None:
+        """Get a URL opener carrying an authenticated web session cookie.
+
+        Returns:
+            Opener, or None if the web login is not possible (e.g. API keys are
+            not accepted by /web/session/authenticate)
+
+        """
+        if self._web_opener is None and not self._web_login_failed:
+            opener = urllib.request.build_opener(
+                urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()),
+                _NoRedirectHandler(),
+            )
+            payload = {
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"db": self.db, "login": self.username, "password": self.password},
+            }
+            request = urllib.request.Request(
+                f"{self.url}/web/session/authenticate",
+                data=json.dumps(payload).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            try:
+                with opener.open(request) as response:
+                    result = json.loads(response.read()).get("result")
+            except (urllib.error.URLError, ValueError, AttributeError):
+                result = None
+            if isinstance(result, dict) and result.get("uid"):
+                self._web_opener = opener
+            else:
+                self._web_login_failed = True
+        return self._web_opener
+
+    def can_download_content(self) -> bool:
+        """Check whether download_content() can stream attachments over HTTP.
+
+        Streaming is opt-in (ODOO_WEB_DOWNLOAD), since it needs a web session
+        login, which Odoo rejects for API keys and counts as a failed login. The
+        first call logs in; the outcome is remembered, so later calls cost
+        nothing.
+
+        Returns:
+            True if streaming is enabled and a web session is available
+
+        """
+        return self.config.web_download and self._get_web_opener() is not None
+
+    def download_content(self, attachment_id: int, path: Path) -> bool:
+        """Stream an attachment's content to a file over HTTP.
+
+        Downloads /web/content/<id> in chunks, which avoids the base64 overhead
+        of reading the datas field over XML-RPC and never holds the whole file
+        in memory. The content goes to a temporary file that replaces path only
+        once complete, so a failed download leaves nothing behind.
+
+        Args:
+            attachment_id: Attachment ID
+            path: Output file path
+
+        Returns:
+            True if the file was written, False if the content could not be
+            fetched this way (callers should fall back to the datas field)
+
+        """
+        opener = self._get_web_opener() if self.config.web_download else None
+        if opener is None:
+            return False
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.part")
+        try:
+            with (
+                opener.open(f"{self.url}/web/content/{attachment_id}?download=true") as response,
+                tmp_path.open("wb") as f,
+            ):
+                shutil.copyfileobj(response, f, _DOWNLOAD_CHUNK)
+            tmp_path.replace(path)
+        except (OSError, http.client.HTTPException):
+            # URLError (including redirects to the login page) is an OSError; a
+            # genuine local write error resurfaces in the caller's fallback
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
     def execute(
         self,
         model: str,
@@ -67,15 +546,43 @@ class OdooClient:
             Method result
 
         """
-        return self.models.execute_kw(
-            self.db,
-            self.uid,
-            self.password,
-            model,
-            method,
-            args,
-            kwargs,
-        )
+        return self._execute_kw(model, method, list(args), kwargs)
+
+    def batch(
+        self,
+        operations: list[tuple[str, str, list[Any], dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> list[Any]:
+        """Execute several independent model calls concurrently.
+
+        Odoo's XML-RPC endpoint does not implement system.multicall, so the
+        calls cannot share one request; instead they are sent in parallel from
+        worker threads (each with its own connection), which makes the total
+        wait about one round trip instead of one per call.
+
+        Args:
+            operations: (model, method, args, kwargs) tuples
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Method results, in the order of operations
+
+        Examples:
+            >>> client.batch([
+            ...     ("helpdesk.ticket", "write", [[1], {"priority": "2"}], {}),
+            ...     ("helpdesk.ticket", "write", [[2, 3], {"priority": "1"}], {}),
+            ... ])
+            [True, True]
+
+        """
+        if len(operations) <= 1:
+            return [self._execute_kw(*operation) for operation in operations]
+
+        # Authenticate once before fanning out instead of once per worker
+        _ = self.uid
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(operations))) as executor:
+            futures = [executor.submit(self._execute_kw, *operation) for operation in operations]
+        return [future.result() for future in futures]
 
     def execute_sudo(
         self,
@@ -197,16 +704,12 @@ class OdooClient:
             kwargs["order"] = order
 
         # Use execute_kw which properly handles search_read parameters
-        raw_result = self.models.execute_kw(
-            self.db,
-            self.uid,
-            self.password,
+        result: list[dict[str, Any]] = self._execute_kw(
             model,
             "search_read",
             [domain or []],  # domain as positional argument
             kwargs,  # fields, limit, offset, order as kwargs
         )
-        result: list[dict[str, Any]] = raw_result  # type: ignore[assignment]
         return result
 
     def create(
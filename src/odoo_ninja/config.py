@@ -1,66 +1,209 @@
 """Configuration management for Odoo Ninja."""
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
+_ENV_PREFIX = "ODOO_"
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off", ""})
 
-class OdooConfig(BaseSettings):
-    """Odoo connection configuration."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        env_prefix="ODOO_",
-        case_sensitive=False,
-        extra="ignore",
-    )
+def _parse_bool(name: str, value: str | None) -> bool:
+    """Parse a boolean setting the way environment variables usually spell them.
 
-    url: str = Field(..., description="Odoo instance URL")
-    database: str = Field(..., description="Odoo database name")
-    username: str = Field(..., description="Odoo username")
-    password: str = Field(..., description="Odoo password or API key")
-    default_user_id: int | None = Field(None, description="Default user ID for sudo operations")
-    allow_harmful_operations: bool = Field(
-        False,
-        description="Allow harmful operations like posting public comments (visible to customers)",
-    )
+    Args:
+        name: Setting name (for error messages)
+        value: Raw string value (None = unset, i.e. False)
+
+    Returns:
+        Parsed boolean
+
+    Raises:
+        ValueError: If the value is not a recognised boolean
+
+    """
+    if value is None:
+        return False
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    msg = f"Invalid boolean for {_ENV_PREFIX}{name.upper()}: {value!r}"
+    raise ValueError(msg)
+
+
+@dataclass(slots=True, frozen=True)
+class OdooConfig:
+    """Odoo connection configuration.
+
+    Attributes:
+        url: Odoo instance URL
+        database: Odoo database name
+        username: Odoo username
+        password: Odoo password or API key
+        default_user_id: Default user ID for sudo operations
+        allow_harmful_operations: Allow harmful operations like posting public comments
+            (visible to customers)
+        jsonrpc: Talk to Odoo over JSON-RPC (/jsonrpc) instead of XML-RPC
+        web_download: Stream attachment downloads from /web/content through a web
+            session login (password logins only; Odoo rejects API keys there)
+
+    """
+
+    url: str
+    database: str
+    username: str
+    password: str
+    default_user_id: int | None = None
+    allow_harmful_operations: bool = False
+    jsonrpc: bool = False
+    web_download: bool = False
+
+    @classmethod
+    def from_env(cls, env_file: Path | None = None) -> "OdooConfig":
+        """Build the configuration from ODOO_* variables.
+
+        Values from the process environment take precedence over the env file.
+
+        Args:
+            env_file: Optional dotenv file to read defaults from
+
+        Returns:
+            OdooConfig instance
+
+        Raises:
+            ValueError: If a required setting is missing or a value is invalid
+
+        """
+        raw: dict[str, str] = {}
+        if env_file is not None:
+            raw.update(
+                (key.upper(), value)
+                for key, value in dotenv_values(env_file, encoding="utf-8").items()
+                if value is not None
+            )
+        raw.update((key.upper(), value) for key, value in os.environ.items())
+
+        def get(name: str) -> str | None:
+            return raw.get(f"{_ENV_PREFIX}{name.upper()}")
+
+        missing = [
+            f"{_ENV_PREFIX}{name.upper()}"
+            for name in ("url", "database", "username", "password")
+            if not get(name)
+        ]
+        if missing:
+            msg = f"Missing required configuration: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        default_user_id = get("default_user_id")
+        try:
+            user_id = int(default_user_id) if default_user_id else None
+        except ValueError:
+            msg = f"Invalid integer for {_ENV_PREFIX}DEFAULT_USER_ID: {default_user_id!r}"
+            raise ValueError(msg) from None
+
+        return cls(
+            url=get("url") or "",
+            database=get("database") or "",
+            username=get("username") or "",
+            password=get("password") or "",
+            default_user_id=user_id,
+            allow_harmful_operations=_parse_bool(
+                "allow_harmful_operations", get("allow_harmful_operations")
+            ),
+            jsonrpc=_parse_bool("jsonrpc", get("jsonrpc")),
+            web_download=_parse_bool("web_download", get("web_download")),
+        )
+
+    @staticmethod
+    def find_config_file() -> Path | None:
+        """Locate the configuration file.
+
+        Returns:
+            $ODOO_NINJA_CONFIG if set, else the first existing default location,
+            or None if there is no config file
+
+        """
+        if os.environ.get("ODOO_NINJA_CONFIG"):
+            # An explicitly configured file skips the search below
+            return Path(os.environ["ODOO_NINJA_CONFIG"]).expanduser()
+
+        # Try common config locations
+        possible_paths = [
+            Path.cwd() / ".odoo-ninja.env",
+            Path.home() / ".config" / "odoo-ninja" / "config.env",
+            Path.cwd() / ".env",
+        ]
+        for path in possible_paths:
+            if path.exists():
+                return path
+        return None
 
     @classmethod
     def from_file(cls, config_path: Path | None = None) -> "OdooConfig":
         """Load configuration from file.
 
         Args:
-            config_path: Path to config file. If None, uses default locations.
+            config_path: Path to config file. If None, uses $ODOO_NINJA_CONFIG or the
+                default locations.
 
         Returns:
             OdooConfig instance
 
         """
         if config_path is None:
-            # Try common config locations
-            possible_paths = [
-                Path.cwd() / ".odoo-ninja.env",
-                Path.home() / ".config" / "odoo-ninja" / "config.env",
-                Path.cwd() / ".env",
-            ]
-            for path in possible_paths:
-                if path.exists():
-                    config_path = path
-                    break
+            config_path = cls.find_config_file()
 
         if config_path and config_path.exists():
-            return cls(_env_file=str(config_path))  # type: ignore[call-arg]
+            return cls.from_env(config_path)
+
+        return cls.from_env()
 
-        return cls()  # type: ignore[call-arg]
+
+# get_config() result keyed by (config file, its mtime); holds a single entry
+_config_cache: dict[tuple[Path | None, int | None], OdooConfig] = {}
 
 
 def get_config() -> OdooConfig:
     """Get the Odoo configuration.
 
+    The parsed configuration is cached and reused until the config file is
+    modified (or a different one is selected); the returned instance is
+    immutable.
+
     Returns:
         OdooConfig instance
 
     """
-    return OdooConfig.from_file()
+    path = OdooConfig.find_config_file()
+    try:
+        mtime = path.stat().st_mtime_ns if path else None
+    except OSError:
+        mtime = None
+    key = (path, mtime)
+
+    config = _config_cache.get(key)
+    if config is None:
+        config = OdooConfig.from_file(path)
+        _config_cache.clear()
+        _config_cache[key] = config
+    return config
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for data cached between CLI runs.
+
+    Uses $XDG_CACHE_HOME/odoo-ninja, falling back to ~/.cache/odoo-ninja.
+
+    Returns:
+        Cache directory path (not created)
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "odoo-ninja"
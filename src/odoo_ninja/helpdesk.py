@@ -1,30 +1,48 @@
 """Helpdesk operations for Odoo Ninja."""
 
+import asyncio
+from collections.abc import Iterator
 from typing import Any
 
 from odoo_ninja.base import (
-    add_comment as base_add_comment,
-)
-from odoo_ninja.base import (
-    add_note as base_add_note,
-)
-from odoo_ninja.base import (
+    DOWNLOAD_WORKERS,
     add_tag_to_record,
+    add_tags_to_records,
     display_record_detail,
     display_records,
     download_record_attachments,
     get_record,
+    get_record_attachments_tags,
     get_record_url,
+    get_records,
     list_fields,
     list_records,
     set_record_fields,
 )
+from odoo_ninja.base import (
+    add_comment as base_add_comment,
+)
+from odoo_ninja.base import (
+    add_comments as base_add_comments,
+)
+from odoo_ninja.base import (
+    add_note as base_add_note,
+)
+from odoo_ninja.base import (
+    add_notes as base_add_notes,
+)
 from odoo_ninja.base import (
     create_attachment as base_create_attachment,
 )
 from odoo_ninja.base import (
     display_tags as base_display_tags,
 )
+from odoo_ninja.base import (
+    get_tag_id_by_name as base_get_tag_id_by_name,
+)
+from odoo_ninja.base import (
+    iter_messages as base_iter_messages,
+)
 from odoo_ninja.base import (
     list_attachments as base_list_attachments,
 )
@@ -40,6 +58,30 @@ from odoo_ninja.client import OdooClient
 MODEL = "helpdesk.ticket"
 TAG_MODEL = "helpdesk.tag"
 
+# Fields rendered by display_ticket_detail(); pass to get_ticket() to skip the rest
+TICKET_DETAIL_FIELDS = [
+    "id",
+    "name",
+    "partner_id",
+    "stage_id",
+    "user_id",
+    "priority",
+    "tag_ids",
+    "description",
+]
+
+# Fields fetched by list_tickets() when the caller does not ask for specific ones
+_DEFAULT_FIELDS = [
+    "id",
+    "name",
+    "partner_id",
+    "stage_id",
+    "user_id",
+    "priority",
+    "tag_ids",
+    "create_date",
+]
+
 
 def list_tickets(
     client: OdooClient,
@@ -60,16 +102,7 @@ def list_tickets(
 
     """
     if fields is None:
-        fields = [
-            "id",
-            "name",
-            "partner_id",
-            "stage_id",
-            "user_id",
-            "priority",
-            "tag_ids",
-            "create_date",
-        ]
+        fields = _DEFAULT_FIELDS
 
     return list_records(client, MODEL, domain=domain, limit=limit, fields=fields)
 
@@ -106,17 +139,42 @@ def get_ticket(
     return get_record(client, MODEL, ticket_id, fields=fields)
 
 
-def list_ticket_fields(client: OdooClient) -> dict[str, Any]:
+def get_tickets(
+    client: OdooClient,
+    ticket_ids: list[int],
+    fields: list[str] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Get several tickets in a single read.
+
+    Args:
+        client: Odoo client
+        ticket_ids: Ticket IDs
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Dictionary mapping ticket ID to ticket dictionary
+
+    """
+    return get_records(client, MODEL, ticket_ids, fields=fields)
+
+
+def list_ticket_fields(
+    client: OdooClient,
+    attributes: list[str] | None = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
     """Get all available fields for helpdesk tickets.
 
     Args:
         client: Odoo client
+        attributes: Field attributes to return (None = all attributes)
+        refresh: Fetch the definitions from Odoo even if they are cached
 
     Returns:
-        Dictionary of field definitions with field names as keys
+        Dictionary of field definitions with field names as keys, sorted by name
 
     """
-    return list_fields(client, MODEL)
+    return list_fields(client, MODEL, attributes=attributes, refresh=refresh)
 
 
 def set_ticket_fields(
@@ -199,6 +257,51 @@ def add_note(
     return base_add_note(client, MODEL, ticket_id, message, user_id=user_id, markdown=markdown)
 
 
+def add_comments(
+    client: OdooClient,
+    comments: list[tuple[int, str]],
+    user_id: int | None = None,
+    markdown: bool = False,
+) -> bool:
+    """Add comments to several tickets (visible to customers) in one call.
+
+    Args:
+        client: Odoo client
+        comments: (ticket_id, message) pairs
+        user_id: User ID to post as (uses default if None)
+        markdown: If True, convert markdown to HTML
+
+    Returns:
+        True if successful
+
+    Examples:
+        >>> add_comments(client, [(42, "SLA breached"), (43, "SLA breached")])
+
+    """
+    return base_add_comments(client, MODEL, comments, user_id=user_id, markdown=markdown)
+
+
+def add_notes(
+    client: OdooClient,
+    notes: list[tuple[int, str]],
+    user_id: int | None = None,
+    markdown: bool = False,
+) -> bool:
+    """Add internal notes to several tickets (not visible to customers) in one call.
+
+    Args:
+        client: Odoo client
+        notes: (ticket_id, message) pairs
+        user_id: User ID to post as (uses default if None)
+        markdown: If True, convert markdown to HTML
+
+    Returns:
+        True if successful
+
+    """
+    return base_add_notes(client, MODEL, notes, user_id=user_id, markdown=markdown)
+
+
 def list_tags(client: OdooClient) -> list[dict[str, Any]]:
     """List available helpdesk tags.
 
@@ -212,6 +315,20 @@ def list_tags(client: OdooClient) -> list[dict[str, Any]]:
     return base_list_tags(client, TAG_MODEL)
 
 
+def get_tag_id_by_name(client: OdooClient, name: str) -> int | None:
+    """Find a helpdesk tag ID by its name.
+
+    Args:
+        client: Odoo client
+        name: Tag name
+
+    Returns:
+        Tag ID, or None if no tag has that name
+
+    """
+    return base_get_tag_id_by_name(client, TAG_MODEL, name)
+
+
 def display_tags(tags: list[dict[str, Any]]) -> None:
     """Display tags in a rich table.
 
@@ -229,6 +346,9 @@ def add_tag_to_ticket(
 ) -> bool:
     """Add a tag to a ticket.
 
+    Links the tag with a single write; other tags on the ticket are kept and
+    adding a tag that is already present is a no-op.
+
     Args:
         client: Odoo client
         ticket_id: Ticket ID
@@ -241,10 +361,33 @@ def add_tag_to_ticket(
     return add_tag_to_record(client, MODEL, ticket_id, tag_id)
 
 
+def add_tags_to_tickets(
+    client: OdooClient,
+    pairs: list[tuple[int, int]],
+    max_workers: int = 8,
+) -> bool:
+    """Add tags to several tickets, batching the writes.
+
+    Args:
+        client: Odoo client
+        pairs: (ticket_id, tag_id) pairs
+        max_workers: Maximum number of writes in flight at once
+
+    Returns:
+        True if successful
+
+    Examples:
+        >>> add_tags_to_tickets(client, [(42, 1), (43, 1), (44, 2)])
+
+    """
+    return add_tags_to_records(client, MODEL, pairs, max_workers=max_workers)
+
+
 def list_messages(
     client: OdooClient,
     ticket_id: int,
     limit: int | None = None,
+    message_types: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """List messages/chatter for a ticket.
 
@@ -252,29 +395,53 @@ def list_messages(
         client: Odoo client
         ticket_id: Ticket ID
         limit: Maximum number of messages (None = all)
+        message_types: Only list these message types, e.g. ['comment', 'email'] (None = all)
 
     Returns:
         List of message dictionaries
 
     """
-    return base_list_messages(client, MODEL, ticket_id, limit=limit)
+    return base_list_messages(client, MODEL, ticket_id, limit=limit, message_types=message_types)
+
+
+def iter_messages(
+    client: OdooClient,
+    ticket_id: int,
+    message_types: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over a ticket's messages, fetching them page by page.
+
+    Args:
+        client: Odoo client
+        ticket_id: Ticket ID
+        message_types: Only yield these message types (None = all)
+
+    Yields:
+        Message dictionaries, newest first
+
+    """
+    yield from base_iter_messages(client, MODEL, ticket_id, message_types=message_types)
 
 
 def list_attachments(
     client: OdooClient,
     ticket_id: int,
+    fields: list[str] | None = None,
+    extension: str | None = None,
 ) -> list[dict[str, Any]]:
     """List attachments for a ticket.
 
     Args:
         client: Odoo client
         ticket_id: Ticket ID
+        fields: List of fields to fetch (None = fields used by display_attachments)
+        extension: Only list files with this extension (e.g., 'pdf')
 
     Returns:
         List of attachment dictionaries
 
     """
-    return base_list_attachments(client, MODEL, ticket_id)
+    return base_list_attachments(client, MODEL, ticket_id, fields=fields, extension=extension)
 
 
 def download_ticket_attachments(
@@ -282,6 +449,9 @@ def download_ticket_attachments(
     ticket_id: int,
     output_dir: Any = None,
     extension: str | None = None,
+    *,
+    max_workers: int = DOWNLOAD_WORKERS,
+    attachments: list[dict[str, Any]] | None = None,
 ) -> list[Any]:
     """Download all attachments from a ticket.
 
@@ -290,12 +460,22 @@ def download_ticket_attachments(
         ticket_id: Ticket ID
         output_dir: Output directory (defaults to current directory)
         extension: File extension filter (e.g., 'pdf', 'jpg')
+        max_workers: Number of files decoded and written in parallel
+        attachments: Attachment records already fetched with 'name' and 'datas'
 
     Returns:
         List of paths to downloaded files
 
     """
-    return download_record_attachments(client, MODEL, ticket_id, output_dir, extension=extension)
+    return download_record_attachments(
+        client,
+        MODEL,
+        ticket_id,
+        output_dir,
+        extension=extension,
+        max_workers=max_workers,
+        attachments=attachments,
+    )
 
 
 def create_attachment(
@@ -343,3 +523,47 @@ def get_ticket_url(client: OdooClient, ticket_id: int) -> str:
 
     """
     return get_record_url(client, MODEL, ticket_id)
+
+
+def get_ticket_bundle(
+    client: OdooClient,
+    ticket_id: int,
+    fields: list[str] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch a ticket, its attachments and the available tags in one round trip.
+
+    Args:
+        client: Odoo client
+        ticket_id: Ticket ID
+        fields: List of field names to read on the ticket (None = all fields)
+
+    Returns:
+        Tuple of (ticket, attachments, tags)
+
+    Raises:
+        ValueError: If ticket not found
+
+    """
+    return get_record_attachments_tags(client, MODEL, ticket_id, TAG_MODEL, fields=fields)
+
+
+async def aget_ticket_bundle(
+    client: OdooClient,
+    ticket_id: int,
+    fields: list[str] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Async version of get_ticket_bundle().
+
+    Args:
+        client: Odoo client
+        ticket_id: Ticket ID
+        fields: List of field names to read on the ticket (None = all fields)
+
+    Returns:
+        Tuple of (ticket, attachments, tags)
+
+    Examples:
+        >>> ticket, attachments, tags = asyncio.run(aget_ticket_bundle(client, 42))
+
+    """
+    return await asyncio.to_thread(get_ticket_bundle, client, ticket_id, fields)
@@ -1,77 +1,19 @@
 """Main CLI application for Odoo Ninja."""
 
+import atexit
+from collections.abc import Callable
+from functools import cache, wraps
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
 import typer
-from rich.console import Console
 
-from odoo_ninja.base import (
-    display_attachments,
-    display_messages,
-    download_attachment,
-    parse_field_assignment,
-)
-from odoo_ninja.client import OdooClient
-from odoo_ninja.config import get_config
-from odoo_ninja.helpdesk import (
-    add_comment,
-    add_note,
-    add_tag_to_ticket,
-    create_attachment,
-    display_tags,
-    display_ticket_detail,
-    display_tickets,
-    download_ticket_attachments,
-    get_ticket,
-    get_ticket_url,
-    list_attachments,
-    list_messages,
-    list_tags,
-    list_ticket_fields,
-    list_tickets,
-    set_ticket_fields,
-)
-from odoo_ninja.project import (
-    add_comment as add_task_comment,
-)
-from odoo_ninja.project import (
-    add_note as add_task_note,
-)
-from odoo_ninja.project import (
-    add_tag_to_task,
-    create_task_attachment,
-    display_task_detail,
-    display_task_tags,
-    display_tasks,
-    download_task_attachments,
-    get_task,
-    get_task_url,
-    list_task_attachments,
-    list_task_fields,
-    list_task_messages,
-    list_task_tags,
-    list_tasks,
-    set_task_fields,
-)
-from odoo_ninja.project_project import (
-    add_comment as add_project_comment,
-)
-from odoo_ninja.project_project import (
-    add_note as add_project_note,
-)
-from odoo_ninja.project_project import (
-    create_project_attachment,
-    display_project_detail,
-    display_projects,
-    get_project,
-    get_project_url,
-    list_project_attachments,
-    list_project_fields,
-    list_project_messages,
-    list_projects,
-    set_project_fields,
-)
+# Command modules and Rich are imported when a command runs, so --help and shell
+# completion only pay for Typer
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from odoo_ninja.client import OdooClient
 
 app = typer.Typer(
     name="odoo-ninja",
@@ -100,20 +42,62 @@ project_project_app = typer.Typer(
 )
 app.add_typer(project_project_app, name="project")
 
-# Global state for console configuration
-_console_config = {"no_color": False}
+# Set by main_callback before any command runs; see __getattr__ for other users
+console: "Console"
 
-console = Console()
 
+def __getattr__(name: str) -> Any:
+    """Create the default console when it is used outside the CLI.
 
-def get_console() -> Console:
-    """Get console instance with current configuration.
+    Args:
+        name: Module attribute name
+
+    Returns:
+        Default console for 'console'
+
+    Raises:
+        AttributeError: For any other name
+
+    """
+    if name == "console":
+        from rich.console import Console
+
+        global console  # noqa: PLW0603
+        console = Console()
+        return console
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+class _LazyConsole:
+    """Console stand-in that creates the Rich console on first use.
+
+    Importing Rich costs more than a url command itself, so commands that print
+    plain text through typer.echo() never load it.
+    """
+
+    def __init__(self, no_color: bool) -> None:
+        self._no_color = no_color
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(self._no_color), name)
+
+
+@cache
+def get_console(no_color: bool = False) -> "Console":
+    """Get console instance for the given color setting.
+
+    Consoles are cached per setting, so Rich probes the terminal only once.
+
+    Args:
+        no_color: Disable colored output
 
     Returns:
         Console instance
 
     """
-    no_color = _console_config["no_color"]
+    from rich.console import Console
+
     return Console(force_terminal=not no_color, no_color=no_color)
 
 
@@ -123,7 +107,7 @@ def version_callback(value: bool) -> None:
         from importlib.metadata import version
 
         app_version = version("odoo-ninja")
-        console.print(f"odoo-ninja version {app_version}")
+        typer.echo(f"odoo-ninja version {app_version}")
         raise typer.Exit()
 
 
@@ -139,23 +123,71 @@ def main_callback(
     ] = False,
 ) -> None:
     """Global options for odoo-ninja CLI."""
-    _console_config["no_color"] = no_color
     global console  # noqa: PLW0603
-    console = get_console()
+    console = cast("Console", _LazyConsole(no_color))
 
 
-def get_client() -> OdooClient:
+@cache
+def get_client() -> "OdooClient":
     """Get configured Odoo client.
 
+    The client is created once per process, so everything run in one
+    invocation shares its authenticated uid and kept-alive connection.
+
     Returns:
         OdooClient instance
 
     """
+    from odoo_ninja.client import OdooClient
+    from odoo_ninja.config import get_config
+
     config = get_config()
-    return OdooClient(config)
+    client = OdooClient(config)
+    atexit.register(client.close)
+    return client
+
+
+def invalidate_client() -> None:
+    """Close and forget the client cached by get_client().
+
+    The next get_client() call reads the configuration again and connects anew,
+    e.g. after the configuration file was edited in a long-running process.
+    """
+    if get_client.cache_info().currsize:
+        client = get_client()
+        client.close()
+        atexit.unregister(client.close)
+    get_client.cache_clear()
+
+
+def _cli_errors[**P, R](command: Callable[P, R]) -> Callable[P, R]:
+    """Report errors raised by a command and exit with status 1.
+
+    typer.Exit raised by the command itself passes through unchanged.
+
+    Args:
+        command: Command function
+
+    Returns:
+        Wrapped command function
+
+    """
+
+    @wraps(command)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return command(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+
+    return wrapper
 
 
 @helpdesk_app.command("list")
+@_cli_errors
 def helpdesk_list(
     stage: Annotated[str | None, typer.Option(help="Filter by stage name")] = None,
     partner: Annotated[str | None, typer.Option(help="Filter by partner name")] = None,
@@ -167,6 +199,8 @@ def helpdesk_list(
     ] = None,
 ) -> None:
     """List helpdesk tickets."""
+    from odoo_ninja.helpdesk import display_tickets, list_tickets
+
     client = get_client()
 
     # Build domain filters
@@ -178,16 +212,13 @@ def helpdesk_list(
     if assigned_to:
         domain.append(("user_id.name", "ilike", assigned_to))
 
-    try:
-        tickets = list_tickets(client, domain=domain, limit=limit, fields=fields)
-        display_tickets(tickets)
-        console.print(f"\n[dim]Found {len(tickets)} tickets[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    tickets = list_tickets(client, domain=domain, limit=limit, fields=fields)
+    display_tickets(tickets)
+    console.print(f"\n[dim]Found {len(tickets)} tickets[/dim]")
 
 
 @helpdesk_app.command("show")
+@_cli_errors
 def helpdesk_show(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     fields: Annotated[
@@ -200,24 +231,25 @@ def helpdesk_show(
     ] = False,
 ) -> None:
     """Show detailed ticket information."""
+    from odoo_ninja.helpdesk import TICKET_DETAIL_FIELDS, display_ticket_detail, get_ticket
+
     client = get_client()
 
-    try:
-        ticket = get_ticket(client, ticket_id, fields=fields)
+    # Without --field, read only what display_ticket_detail renders
+    ticket = get_ticket(client, ticket_id, fields=fields or TICKET_DETAIL_FIELDS)
 
-        if fields:
-            # If specific fields requested, show them directly
-            console.print(f"\n[bold cyan]Ticket #{ticket_id}[/bold cyan]\n")
-            for key, value in sorted(ticket.items()):
-                console.print(f"[bold]{key}:[/bold] {value}")
-        else:
-            display_ticket_detail(ticket, show_html=show_html)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    if fields:
+        # If specific fields requested, show them directly, in the order given
+        console.print(f"\n[bold cyan]Ticket #{ticket_id}[/bold cyan]\n")
+        missing = "[dim]<missing>[/dim]"
+        lines = [f"[bold]{key}:[/bold] {ticket.get(key, missing)}" for key in fields]
+        console.print("\n".join(lines))
+    else:
+        display_ticket_detail(ticket, show_html=show_html)
 
 
 @helpdesk_app.command("comment")
+@_cli_errors
 def helpdesk_comment(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     message: Annotated[str, typer.Argument(help="Comment message")],
@@ -230,6 +262,8 @@ def helpdesk_comment(
     ] = False,
 ) -> None:
     """Add a comment to a ticket (visible to customers)."""
+    from odoo_ninja.helpdesk import add_comment
+
     client = get_client()
 
     # Check if harmful operations are allowed
@@ -242,19 +276,16 @@ def helpdesk_comment(
         )
         raise typer.Exit(1)
 
-    try:
-        success = add_comment(client, ticket_id, message, user_id=user_id, markdown=markdown)
-        if success:
-            console.print(f"[green]Successfully added comment to ticket {ticket_id}[/green]")
-        else:
-            console.print(f"[red]Failed to add comment to ticket {ticket_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    success = add_comment(client, ticket_id, message, user_id=user_id, markdown=markdown)
+    if success:
+        console.print(f"[green]Successfully added comment to ticket {ticket_id}[/green]")
+    else:
+        console.print(f"[red]Failed to add comment to ticket {ticket_id}[/red]")
+        raise typer.Exit(1)
 
 
 @helpdesk_app.command("note")
+@_cli_errors
 def helpdesk_note(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     message: Annotated[str, typer.Argument(help="Note message")],
@@ -267,51 +298,48 @@ def helpdesk_note(
     ] = False,
 ) -> None:
     """Add an internal note to a ticket (not visible to customers)."""
+    from odoo_ninja.helpdesk import add_note
+
     client = get_client()
 
-    try:
-        success = add_note(client, ticket_id, message, user_id=user_id, markdown=markdown)
-        if success:
-            console.print(f"[green]Successfully added note to ticket {ticket_id}[/green]")
-        else:
-            console.print(f"[red]Failed to add note to ticket {ticket_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    success = add_note(client, ticket_id, message, user_id=user_id, markdown=markdown)
+    if success:
+        console.print(f"[green]Successfully added note to ticket {ticket_id}[/green]")
+    else:
+        console.print(f"[red]Failed to add note to ticket {ticket_id}[/red]")
+        raise typer.Exit(1)
 
 
 @helpdesk_app.command("tags")
+@_cli_errors
 def helpdesk_tags() -> None:
     """List available helpdesk tags."""
+    from odoo_ninja.helpdesk import display_tags, list_tags
+
     client = get_client()
 
-    try:
-        tags = list_tags(client)
-        display_tags(tags)
-        console.print(f"\n[dim]Found {len(tags)} tags[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    tags = list_tags(client)
+    display_tags(tags)
+    console.print(f"\n[dim]Found {len(tags)} tags[/dim]")
 
 
 @helpdesk_app.command("tag")
+@_cli_errors
 def helpdesk_tag(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     tag_id: Annotated[int, typer.Argument(help="Tag ID")],
 ) -> None:
     """Add a tag to a ticket."""
+    from odoo_ninja.helpdesk import add_tag_to_ticket
+
     client = get_client()
 
-    try:
-        add_tag_to_ticket(client, ticket_id, tag_id)
-        console.print(f"[green]Successfully added tag {tag_id} to ticket {ticket_id}[/green]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    add_tag_to_ticket(client, ticket_id, tag_id)
+    console.print(f"[green]Successfully added tag {tag_id} to ticket {ticket_id}[/green]")
 
 
 @helpdesk_app.command("chatter")
+@_cli_errors
 def helpdesk_chatter(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     limit: Annotated[
@@ -322,41 +350,56 @@ def helpdesk_chatter(
         bool,
         typer.Option("--html", help="Show raw HTML body instead of plain text"),
     ] = False,
+    message_types: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--type",
+            "-t",
+            help="Only show this message type, e.g. comment, email, notification "
+            "(can be used multiple times)",
+        ),
+    ] = None,
 ) -> None:
     """Show message history/chatter for a ticket."""
+    from odoo_ninja.base import display_messages
+    from odoo_ninja.helpdesk import iter_messages, list_messages
+
     client = get_client()
 
-    try:
-        messages = list_messages(client, ticket_id, limit=limit)
-        if messages:
-            display_messages(messages, show_html=show_html)
-        else:
-            console.print(f"[yellow]No messages found for ticket {ticket_id}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    # Without a limit, stream the history page by page instead of loading it all
+    messages = (
+        iter_messages(client, ticket_id, message_types=message_types)
+        if limit is None
+        else list_messages(client, ticket_id, limit=limit, message_types=message_types)
+    )
+    display_messages(
+        messages,
+        show_html=show_html,
+        empty_message=f"No messages found for ticket {ticket_id}",
+    )
 
 
 @helpdesk_app.command("attachments")
+@_cli_errors
 def helpdesk_attachments(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
 ) -> None:
     """List attachments for a ticket."""
+    from odoo_ninja.base import display_attachments
+    from odoo_ninja.helpdesk import list_attachments
+
     client = get_client()
 
-    try:
-        attachments = list_attachments(client, ticket_id)
-        if attachments:
-            display_attachments(attachments)
-            console.print(f"\n[dim]Found {len(attachments)} attachments[/dim]")
-        else:
-            console.print(f"[yellow]No attachments found for ticket {ticket_id}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    attachments = list_attachments(client, ticket_id)
+    if attachments:
+        display_attachments(attachments)
+        console.print(f"\n[dim]Found {len(attachments)} attachments[/dim]")
+    else:
+        console.print(f"[yellow]No attachments found for ticket {ticket_id}[/yellow]")
 
 
 @helpdesk_app.command("download")
+@_cli_errors
 def helpdesk_download(
     attachment_id: Annotated[int, typer.Argument(help="Attachment ID")],
     output: Annotated[
@@ -365,17 +408,16 @@ def helpdesk_download(
     ] = None,
 ) -> None:
     """Download a single attachment by ID."""
+    from odoo_ninja.base import download_attachment
+
     client = get_client()
 
-    try:
-        output_path = download_attachment(client, attachment_id, output)
-        console.print(f"[green]Downloaded attachment to {output_path}[/green]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    output_path = download_attachment(client, attachment_id, output)
+    console.print(f"[green]Downloaded attachment to {output_path}[/green]")
 
 
 @helpdesk_app.command("download-all")
+@_cli_errors
 def helpdesk_download_all(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     output_dir: Annotated[
@@ -388,110 +430,100 @@ def helpdesk_download_all(
     ] = None,
 ) -> None:
     """Download all attachments from a ticket."""
+    from odoo_ninja.helpdesk import download_ticket_attachments, list_attachments
+
     client = get_client()
 
-    try:
-        # First check if there are any attachments
-        attachments = list_attachments(client, ticket_id)
-        if not attachments:
-            console.print(f"[yellow]No attachments found for ticket {ticket_id}[/yellow]")
-            return
-
-        # Filter by extension if provided
-        if extension:
-            ext = extension.lower().lstrip(".")
-            filtered_attachments = [
-                att for att in attachments
-                if att.get("name", "").lower().endswith(f".{ext}")
-            ]
-            if not filtered_attachments:
-                console.print(
-                    f"[yellow]No {ext} attachments found for ticket {ticket_id}[/yellow]"
-                )
-                return
-            console.print(
-                f"[cyan]Downloading {len(filtered_attachments)} .{ext} attachments...[/cyan]"
-            )
-        else:
-            console.print(f"[cyan]Downloading {len(attachments)} attachments...[/cyan]")
+    # Fetch names and data in one call; the extension filter runs server-side
+    attachments = list_attachments(client, ticket_id, fields=["name", "datas"], extension=extension)
+    ext = extension.lower().lstrip(".") if extension else None
+    if not attachments:
+        kind = f"{ext} attachments" if ext else "attachments"
+        console.print(f"[yellow]No {kind} found for ticket {ticket_id}[/yellow]")
+        return
 
-        downloaded_files = download_ticket_attachments(
-            client, ticket_id, output_dir, extension=extension
-        )
+    kind = f".{ext} attachments" if ext else "attachments"
+    console.print(f"[cyan]Downloading {len(attachments)} {kind}...[/cyan]")
 
-        if downloaded_files:
-            console.print(
-                f"\n[green]Successfully downloaded {len(downloaded_files)} files:[/green]"
-            )
-            for file_path in downloaded_files:
-                console.print(f"  - {file_path}")
-        else:
-            console.print("[yellow]No files were downloaded[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    downloaded_files = download_ticket_attachments(
+        client, ticket_id, output_dir, attachments=attachments
+    )
+
+    if downloaded_files:
+        console.print(f"\n[green]Successfully downloaded {len(downloaded_files)} files:[/green]")
+        console.print("\n".join(f"  - {file_path}" for file_path in downloaded_files))
+    else:
+        console.print("[yellow]No files were downloaded[/yellow]")
 
 
 @helpdesk_app.command("fields")
-def helpdesk_fields(  # noqa: PLR0912
+@_cli_errors
+def helpdesk_fields(
     ticket_id: Annotated[int | None, typer.Argument(help="Ticket ID (optional)")] = None,
     field_name: Annotated[
         str | None,
         typer.Option(help="Show details for a specific field"),
     ] = None,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Fetch field definitions from Odoo instead of the cache"),
+    ] = False,
 ) -> None:
     """List available fields or show field values for a specific ticket."""
+    from odoo_ninja.helpdesk import get_ticket, list_ticket_fields
+
     client = get_client()
 
-    try:
-        if ticket_id:
-            # Show fields for a specific ticket
-            ticket = get_ticket(client, ticket_id)
-            console.print(f"\n[bold cyan]Fields for Ticket #{ticket_id}[/bold cyan]\n")
-
-            if field_name:
-                # Show specific field
-                if field_name in ticket:
-                    console.print(f"[bold]{field_name}:[/bold] {ticket[field_name]}")
-                else:
-                    console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+    if ticket_id:
+        # Show fields for a specific ticket
+        ticket = get_ticket(client, ticket_id)
+        console.print(f"\n[bold cyan]Fields for Ticket #{ticket_id}[/bold cyan]\n")
+
+        if field_name:
+            # Show specific field
+            if field_name in ticket:
+                console.print(f"[bold]{field_name}:[/bold] {ticket[field_name]}")
             else:
-                # Show all fields
-                for key, value in sorted(ticket.items()):
-                    console.print(f"[bold]{key}:[/bold] {value}")
+                console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
         else:
-            # List all available fields
-            fields = list_ticket_fields(client)
-            console.print("\n[bold cyan]Available Helpdesk Ticket Fields[/bold cyan]\n")
-
-            if field_name:
-                # Show specific field definition
-                if field_name in fields:
-                    field_def = fields[field_name]
-                    console.print(f"[bold]{field_name}[/bold]")
-                    console.print(f"  Type: {field_def.get('type', 'N/A')}")
-                    console.print(f"  String: {field_def.get('string', 'N/A')}")
-                    console.print(f"  Required: {field_def.get('required', False)}")
-                    console.print(f"  Readonly: {field_def.get('readonly', False)}")
-                    if field_def.get('help'):
-                        console.print(f"  Help: {field_def['help']}")
-                else:
-                    console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+            # Show all fields
+            lines = [f"[bold]{key}:[/bold] {ticket[key]}" for key in sorted(ticket)]
+            console.print("\n".join(lines))
+    else:
+        # List all available fields, fetching only the attributes printed below
+        attributes = ["type", "string"]
+        attributes += ["required", "readonly", "help"] if field_name else []
+        fields = list_ticket_fields(client, attributes=attributes, refresh=refresh)
+        console.print("\n[bold cyan]Available Helpdesk Ticket Fields[/bold cyan]\n")
+
+        if field_name:
+            # Show specific field definition
+            if field_name in fields:
+                field_def = fields[field_name]
+                console.print(f"[bold]{field_name}[/bold]")
+                console.print(f"  Type: {field_def.get('type', 'N/A')}")
+                console.print(f"  String: {field_def.get('string', 'N/A')}")
+                console.print(f"  Required: {field_def.get('required', False)}")
+                console.print(f"  Readonly: {field_def.get('readonly', False)}")
+                if field_def.get('help'):
+                    console.print(f"  Help: {field_def['help']}")
             else:
-                # List all field names and types
-                for name, definition in sorted(fields.items()):
-                    field_type = definition.get("type", "unknown")
-                    field_label = definition.get("string", name)
-                    console.print(f"[cyan]{name}[/cyan] ({field_type}) - {field_label}")
+                console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+        else:
+            # List all field names and types
+            lines = [
+                f"[cyan]{name}[/cyan] ({definition.get('type', 'unknown')}) - "
+                f"{definition.get('string', name)}"
+                for name, definition in fields.items()
+            ]
+            console.print("\n".join(lines), highlight=False)
 
-                console.print(f"\n[dim]Total: {len(fields)} fields[/dim]")
-                console.print("[dim]Use --field-name to see details for a specific field[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+            console.print(f"\n[dim]Total: {len(fields)} fields[/dim]")
+            console.print("[dim]Use --field-name to see details for a specific field[/dim]")
 
 
 @helpdesk_app.command("set")
+@_cli_errors
 def helpdesk_set(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     fields: Annotated[
@@ -509,38 +541,25 @@ def helpdesk_set(
         odoo-ninja helpdesk set 42 priority+=1
         odoo-ninja helpdesk set 42 'tag_ids=json:[[6,0,[1,2,3]]]'
     """
+    from odoo_ninja.base import parse_field_assignments
+    from odoo_ninja.helpdesk import set_ticket_fields
+
     client = get_client()
 
-    # Parse field assignments
-    values: dict[str, Any] = {}
-
-    try:
-        for field_assignment in fields:
-            field, value = parse_field_assignment(
-                client, "helpdesk.ticket", ticket_id, field_assignment
-            )
-            values[field] = value
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
-
-    try:
-        success = set_ticket_fields(client, ticket_id, values)
-        if success:
-            console.print(
-                f"[green]Successfully updated ticket {ticket_id}[/green]"
-            )
-            for field, value in values.items():
-                console.print(f"  {field} = {value}")
-        else:
-            console.print(f"[red]Failed to set fields on ticket {ticket_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    values = parse_field_assignments(client, "helpdesk.ticket", ticket_id, fields)
+
+    success = set_ticket_fields(client, ticket_id, values)
+    if success:
+        console.print(f"[green]Successfully updated ticket {ticket_id}[/green]")
+        for field, value in values.items():
+            console.print(f"  {field} = {value}")
+    else:
+        console.print(f"[red]Failed to set fields on ticket {ticket_id}[/red]")
+        raise typer.Exit(1)
 
 
 @helpdesk_app.command("attach")
+@_cli_errors
 def helpdesk_attach(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
     file_path: Annotated[Path, typer.Argument(help="Path to file to attach")],
@@ -550,42 +569,38 @@ def helpdesk_attach(
     ] = None,
 ) -> None:
     """Attach a file to a ticket."""
+    from odoo_ninja.helpdesk import create_attachment, get_ticket_url
+
     client = get_client()
 
-    try:
-        attachment_id = create_attachment(client, ticket_id, file_path, name=name)
-        console.print(
-            f"[green]Successfully attached {file_path.name} to ticket {ticket_id}[/green]"
-        )
-        console.print(f"[dim]Attachment ID: {attachment_id}[/dim]")
+    attachment_id = create_attachment(client, ticket_id, file_path, name=name)
+    console.print(f"[green]Successfully attached {file_path.name} to ticket {ticket_id}[/green]")
+    console.print(f"[dim]Attachment ID: {attachment_id}[/dim]")
 
-        # Show ticket URL for verification
-        url = get_ticket_url(client, ticket_id)
-        console.print(f"\n[cyan]View ticket:[/cyan] {url}")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    # Show ticket URL for verification
+    url = get_ticket_url(client, ticket_id)
+    console.print(f"\n[cyan]View ticket:[/cyan] {url}")
 
 
 @helpdesk_app.command("url")
+@_cli_errors
 def helpdesk_url(
     ticket_id: Annotated[int, typer.Argument(help="Ticket ID")],
 ) -> None:
     """Get the web URL for a ticket."""
+    from odoo_ninja.helpdesk import get_ticket_url
+
     client = get_client()
 
-    try:
-        url = get_ticket_url(client, ticket_id)
-        console.print(url)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    url = get_ticket_url(client, ticket_id)
+    typer.echo(url)
 
 
 # Project task commands
 
 
 @project_task_app.command("list")
+@_cli_errors
 def project_list(
     project: Annotated[str | None, typer.Option(help="Filter by project name")] = None,
     stage: Annotated[str | None, typer.Option(help="Filter by stage name")] = None,
@@ -597,6 +612,8 @@ def project_list(
     ] = None,
 ) -> None:
     """List project tasks."""
+    from odoo_ninja.project import display_tasks, list_tasks
+
     client = get_client()
 
     # Build domain filters
@@ -608,16 +625,13 @@ def project_list(
     if assigned_to:
         domain.append(("user_ids.name", "ilike", assigned_to))
 
-    try:
-        tasks = list_tasks(client, domain=domain, limit=limit, fields=fields)
-        display_tasks(tasks)
-        console.print(f"\n[dim]Found {len(tasks)} tasks[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    tasks = list_tasks(client, domain=domain, limit=limit, fields=fields)
+    display_tasks(tasks)
+    console.print(f"\n[dim]Found {len(tasks)} tasks[/dim]")
 
 
 @project_task_app.command("show")
+@_cli_errors
 def project_show(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     fields: Annotated[
@@ -630,24 +644,24 @@ def project_show(
     ] = False,
 ) -> None:
     """Show detailed task information."""
+    from odoo_ninja.project import display_task_detail, get_task
+
     client = get_client()
 
-    try:
-        task = get_task(client, task_id, fields=fields)
+    task = get_task(client, task_id, fields=fields)
 
-        if fields:
-            # If specific fields requested, show them directly
-            console.print(f"\n[bold cyan]Task #{task_id}[/bold cyan]\n")
-            for key, value in sorted(task.items()):
-                console.print(f"[bold]{key}:[/bold] {value}")
-        else:
-            display_task_detail(task, show_html=show_html)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    if fields:
+        # If specific fields requested, show them directly, in the order given
+        console.print(f"\n[bold cyan]Task #{task_id}[/bold cyan]\n")
+        missing = "[dim]<missing>[/dim]"
+        lines = [f"[bold]{key}:[/bold] {task.get(key, missing)}" for key in fields]
+        console.print("\n".join(lines))
+    else:
+        display_task_detail(task, show_html=show_html)
 
 
 @project_task_app.command("comment")
+@_cli_errors
 def project_comment(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     message: Annotated[str, typer.Argument(help="Comment message")],
@@ -660,6 +674,8 @@ def project_comment(
     ] = False,
 ) -> None:
     """Add a comment to a task (visible to followers)."""
+    from odoo_ninja.project import add_comment as add_task_comment
+
     client = get_client()
 
     # Check if harmful operations are allowed
@@ -672,19 +688,16 @@ def project_comment(
         )
         raise typer.Exit(1)
 
-    try:
-        success = add_task_comment(client, task_id, message, user_id=user_id, markdown=markdown)
-        if success:
-            console.print(f"[green]Successfully added comment to task {task_id}[/green]")
-        else:
-            console.print(f"[red]Failed to add comment to task {task_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    success = add_task_comment(client, task_id, message, user_id=user_id, markdown=markdown)
+    if success:
+        console.print(f"[green]Successfully added comment to task {task_id}[/green]")
+    else:
+        console.print(f"[red]Failed to add comment to task {task_id}[/red]")
+        raise typer.Exit(1)
 
 
 @project_task_app.command("note")
+@_cli_errors
 def project_note(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     message: Annotated[str, typer.Argument(help="Note message")],
@@ -697,51 +710,48 @@ def project_note(
     ] = False,
 ) -> None:
     """Add an internal note to a task."""
+    from odoo_ninja.project import add_note as add_task_note
+
     client = get_client()
 
-    try:
-        success = add_task_note(client, task_id, message, user_id=user_id, markdown=markdown)
-        if success:
-            console.print(f"[green]Successfully added note to task {task_id}[/green]")
-        else:
-            console.print(f"[red]Failed to add note to task {task_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    success = add_task_note(client, task_id, message, user_id=user_id, markdown=markdown)
+    if success:
+        console.print(f"[green]Successfully added note to task {task_id}[/green]")
+    else:
+        console.print(f"[red]Failed to add note to task {task_id}[/red]")
+        raise typer.Exit(1)
 
 
 @project_task_app.command("tags")
+@_cli_errors
 def project_tags() -> None:
     """List available project tags."""
+    from odoo_ninja.project import display_task_tags, list_task_tags
+
     client = get_client()
 
-    try:
-        tags = list_task_tags(client)
-        display_task_tags(tags)
-        console.print(f"\n[dim]Found {len(tags)} tags[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    tags = list_task_tags(client)
+    display_task_tags(tags)
+    console.print(f"\n[dim]Found {len(tags)} tags[/dim]")
 
 
 @project_task_app.command("tag")
+@_cli_errors
 def project_tag(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     tag_id: Annotated[int, typer.Argument(help="Tag ID")],
 ) -> None:
     """Add a tag to a task."""
+    from odoo_ninja.project import add_tag_to_task
+
     client = get_client()
 
-    try:
-        add_tag_to_task(client, task_id, tag_id)
-        console.print(f"[green]Successfully added tag {tag_id} to task {task_id}[/green]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    add_tag_to_task(client, task_id, tag_id)
+    console.print(f"[green]Successfully added tag {tag_id} to task {task_id}[/green]")
 
 
 @project_task_app.command("chatter")
+@_cli_errors
 def project_chatter(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     limit: Annotated[
@@ -752,41 +762,56 @@ def project_chatter(
         bool,
         typer.Option("--html", help="Show raw HTML body instead of plain text"),
     ] = False,
+    message_types: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--type",
+            "-t",
+            help="Only show this message type, e.g. comment, email, notification "
+            "(can be used multiple times)",
+        ),
+    ] = None,
 ) -> None:
     """Show message history/chatter for a task."""
+    from odoo_ninja.base import display_messages
+    from odoo_ninja.project import iter_task_messages, list_task_messages
+
     client = get_client()
 
-    try:
-        messages = list_task_messages(client, task_id, limit=limit)
-        if messages:
-            display_messages(messages, show_html=show_html)
-        else:
-            console.print(f"[yellow]No messages found for task {task_id}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    # Without a limit, stream the history page by page instead of loading it all
+    messages = (
+        iter_task_messages(client, task_id, message_types=message_types)
+        if limit is None
+        else list_task_messages(client, task_id, limit=limit, message_types=message_types)
+    )
+    display_messages(
+        messages,
+        show_html=show_html,
+        empty_message=f"No messages found for task {task_id}",
+    )
 
 
 @project_task_app.command("attachments")
+@_cli_errors
 def project_attachments(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
 ) -> None:
     """List attachments for a task."""
+    from odoo_ninja.base import display_attachments
+    from odoo_ninja.project import list_task_attachments
+
     client = get_client()
 
-    try:
-        attachments = list_task_attachments(client, task_id)
-        if attachments:
-            display_attachments(attachments)
-            console.print(f"\n[dim]Found {len(attachments)} attachments[/dim]")
-        else:
-            console.print(f"[yellow]No attachments found for task {task_id}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    attachments = list_task_attachments(client, task_id)
+    if attachments:
+        display_attachments(attachments)
+        console.print(f"\n[dim]Found {len(attachments)} attachments[/dim]")
+    else:
+        console.print(f"[yellow]No attachments found for task {task_id}[/yellow]")
 
 
 @project_task_app.command("download")
+@_cli_errors
 def project_download(
     attachment_id: Annotated[int, typer.Argument(help="Attachment ID")],
     output: Annotated[
@@ -795,17 +820,16 @@ def project_download(
     ] = None,
 ) -> None:
     """Download a single attachment by ID."""
+    from odoo_ninja.base import download_attachment
+
     client = get_client()
 
-    try:
-        output_path = download_attachment(client, attachment_id, output)
-        console.print(f"[green]Downloaded attachment to {output_path}[/green]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    output_path = download_attachment(client, attachment_id, output)
+    console.print(f"[green]Downloaded attachment to {output_path}[/green]")
 
 
 @project_task_app.command("download-all")
+@_cli_errors
 def project_download_all(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     output_dir: Annotated[
@@ -818,107 +842,102 @@ def project_download_all(
     ] = None,
 ) -> None:
     """Download all attachments from a task."""
+    from odoo_ninja.project import download_task_attachments, list_task_attachments
+
     client = get_client()
 
-    try:
-        # First check if there are any attachments
-        attachments = list_task_attachments(client, task_id)
-        if not attachments:
-            console.print(f"[yellow]No attachments found for task {task_id}[/yellow]")
-            return
-
-        # Filter by extension if provided
-        if extension:
-            ext = extension.lower().lstrip(".")
-            filtered_attachments = [
-                att for att in attachments if att.get("name", "").lower().endswith(f".{ext}")
-            ]
-            if not filtered_attachments:
-                console.print(f"[yellow]No {ext} attachments found for task {task_id}[/yellow]")
-                return
-            console.print(
-                f"[cyan]Downloading {len(filtered_attachments)} .{ext} attachments...[/cyan]"
-            )
-        else:
-            console.print(f"[cyan]Downloading {len(attachments)} attachments...[/cyan]")
+    # Fetch names and data in one call; the extension filter runs server-side
+    attachments = list_task_attachments(
+        client, task_id, fields=["name", "datas"], extension=extension
+    )
+    ext = extension.lower().lstrip(".") if extension else None
+    if not attachments:
+        kind = f"{ext} attachments" if ext else "attachments"
+        console.print(f"[yellow]No {kind} found for task {task_id}[/yellow]")
+        return
 
-        downloaded_files = download_task_attachments(
-            client, task_id, output_dir, extension=extension
-        )
+    kind = f".{ext} attachments" if ext else "attachments"
+    console.print(f"[cyan]Downloading {len(attachments)} {kind}...[/cyan]")
 
-        if downloaded_files:
-            console.print(
-                f"\n[green]Successfully downloaded {len(downloaded_files)} files:[/green]"
-            )
-            for file_path in downloaded_files:
-                console.print(f"  - {file_path}")
-        else:
-            console.print("[yellow]No files were downloaded[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    downloaded_files = download_task_attachments(
+        client, task_id, output_dir, attachments=attachments
+    )
+
+    if downloaded_files:
+        console.print(f"\n[green]Successfully downloaded {len(downloaded_files)} files:[/green]")
+        console.print("\n".join(f"  - {file_path}" for file_path in downloaded_files))
+    else:
+        console.print("[yellow]No files were downloaded[/yellow]")
 
 
 @project_task_app.command("fields")
-def project_fields(  # noqa: PLR0912
+@_cli_errors
+def project_fields(
     task_id: Annotated[int | None, typer.Argument(help="Task ID (optional)")] = None,
     field_name: Annotated[
         str | None,
         typer.Option(help="Show details for a specific field"),
     ] = None,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Fetch field definitions from Odoo instead of the cache"),
+    ] = False,
 ) -> None:
     """List available fields or show field values for a specific task."""
+    from odoo_ninja.project import get_task, list_task_fields
+
     client = get_client()
 
-    try:
-        if task_id:
-            # Show fields for a specific task
-            task = get_task(client, task_id)
-            console.print(f"\n[bold cyan]Fields for Task #{task_id}[/bold cyan]\n")
-
-            if field_name:
-                # Show specific field
-                if field_name in task:
-                    console.print(f"[bold]{field_name}:[/bold] {task[field_name]}")
-                else:
-                    console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+    if task_id:
+        # Show fields for a specific task
+        task = get_task(client, task_id)
+        console.print(f"\n[bold cyan]Fields for Task #{task_id}[/bold cyan]\n")
+
+        if field_name:
+            # Show specific field
+            if field_name in task:
+                console.print(f"[bold]{field_name}:[/bold] {task[field_name]}")
             else:
-                # Show all fields
-                for key, value in sorted(task.items()):
-                    console.print(f"[bold]{key}:[/bold] {value}")
+                console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
         else:
-            # List all available fields
-            fields = list_task_fields(client)
-            console.print("\n[bold cyan]Available Project Task Fields[/bold cyan]\n")
-
-            if field_name:
-                # Show specific field definition
-                if field_name in fields:
-                    field_def = fields[field_name]
-                    console.print(f"[bold]{field_name}[/bold]")
-                    console.print(f"  Type: {field_def.get('type', 'N/A')}")
-                    console.print(f"  String: {field_def.get('string', 'N/A')}")
-                    console.print(f"  Required: {field_def.get('required', False)}")
-                    console.print(f"  Readonly: {field_def.get('readonly', False)}")
-                    if field_def.get("help"):
-                        console.print(f"  Help: {field_def['help']}")
-                else:
-                    console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+            # Show all fields
+            lines = [f"[bold]{key}:[/bold] {task[key]}" for key in sorted(task)]
+            console.print("\n".join(lines))
+    else:
+        # List all available fields, fetching only the attributes printed below
+        attributes = ["type", "string"]
+        attributes += ["required", "readonly", "help"] if field_name else []
+        fields = list_task_fields(client, attributes=attributes, refresh=refresh)
+        console.print("\n[bold cyan]Available Project Task Fields[/bold cyan]\n")
+
+        if field_name:
+            # Show specific field definition
+            if field_name in fields:
+                field_def = fields[field_name]
+                console.print(f"[bold]{field_name}[/bold]")
+                console.print(f"  Type: {field_def.get('type', 'N/A')}")
+                console.print(f"  String: {field_def.get('string', 'N/A')}")
+                console.print(f"  Required: {field_def.get('required', False)}")
+                console.print(f"  Readonly: {field_def.get('readonly', False)}")
+                if field_def.get("help"):
+                    console.print(f"  Help: {field_def['help']}")
             else:
-                # List all field names and types
-                for name, definition in sorted(fields.items()):
-                    field_type = definition.get("type", "unknown")
-                    field_label = definition.get("string", name)
-                    console.print(f"[cyan]{name}[/cyan] ({field_type}) - {field_label}")
+                console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+        else:
+            # List all field names and types
+            lines = [
+                f"[cyan]{name}[/cyan] ({definition.get('type', 'unknown')}) - "
+                f"{definition.get('string', name)}"
+                for name, definition in fields.items()
+            ]
+            console.print("\n".join(lines), highlight=False)
 
-                console.print(f"\n[dim]Total: {len(fields)} fields[/dim]")
-                console.print("[dim]Use --field-name to see details for a specific field[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+            console.print(f"\n[dim]Total: {len(fields)} fields[/dim]")
+            console.print("[dim]Use --field-name to see details for a specific field[/dim]")
 
 
 @project_task_app.command("set")
+@_cli_errors
 def project_set(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     fields: Annotated[
@@ -936,36 +955,25 @@ def project_set(
         odoo-ninja project-task set 42 project_id=10
         odoo-ninja project-task set 42 priority+=1
     """
+    from odoo_ninja.base import parse_field_assignments
+    from odoo_ninja.project import set_task_fields
+
     client = get_client()
 
-    # Parse field assignments
-    values: dict[str, Any] = {}
-
-    try:
-        for field_assignment in fields:
-            field, value = parse_field_assignment(
-                client, "project.task", task_id, field_assignment
-            )
-            values[field] = value
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
-
-    try:
-        success = set_task_fields(client, task_id, values)
-        if success:
-            console.print(f"[green]Successfully updated task {task_id}[/green]")
-            for field, value in values.items():
-                console.print(f"  {field} = {value}")
-        else:
-            console.print(f"[red]Failed to set fields on task {task_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    values = parse_field_assignments(client, "project.task", task_id, fields)
+
+    success = set_task_fields(client, task_id, values)
+    if success:
+        console.print(f"[green]Successfully updated task {task_id}[/green]")
+        for field, value in values.items():
+            console.print(f"  {field} = {value}")
+    else:
+        console.print(f"[red]Failed to set fields on task {task_id}[/red]")
+        raise typer.Exit(1)
 
 
 @project_task_app.command("attach")
+@_cli_errors
 def project_attach(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
     file_path: Annotated[Path, typer.Argument(help="Path to file to attach")],
@@ -975,42 +983,38 @@ def project_attach(
     ] = None,
 ) -> None:
     """Attach a file to a task."""
+    from odoo_ninja.project import create_task_attachment, get_task_url
+
     client = get_client()
 
-    try:
-        attachment_id = create_task_attachment(client, task_id, file_path, name=name)
-        console.print(
-            f"[green]Successfully attached {file_path.name} to task {task_id}[/green]"
-        )
-        console.print(f"[dim]Attachment ID: {attachment_id}[/dim]")
+    attachment_id = create_task_attachment(client, task_id, file_path, name=name)
+    console.print(f"[green]Successfully attached {file_path.name} to task {task_id}[/green]")
+    console.print(f"[dim]Attachment ID: {attachment_id}[/dim]")
 
-        # Show task URL for verification
-        url = get_task_url(client, task_id)
-        console.print(f"\n[cyan]View task:[/cyan] {url}")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    # Show task URL for verification
+    url = get_task_url(client, task_id)
+    console.print(f"\n[cyan]View task:[/cyan] {url}")
 
 
 @project_task_app.command("url")
+@_cli_errors
 def project_url(
     task_id: Annotated[int, typer.Argument(help="Task ID")],
 ) -> None:
     """Get the web URL for a task."""
+    from odoo_ninja.project import get_task_url
+
     client = get_client()
 
-    try:
-        url = get_task_url(client, task_id)
-        console.print(url)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    url = get_task_url(client, task_id)
+    typer.echo(url)
 
 
 # Project (project.project) commands
 
 
 @project_project_app.command("list")
+@_cli_errors
 def project_project_list(
     name: Annotated[str | None, typer.Option(help="Filter by project name")] = None,
     user: Annotated[str | None, typer.Option(help="Filter by project manager name")] = None,
@@ -1022,6 +1026,8 @@ def project_project_list(
     ] = None,
 ) -> None:
     """List projects."""
+    from odoo_ninja.project_project import display_projects, list_projects
+
     client = get_client()
 
     # Build domain filters
@@ -1033,16 +1039,13 @@ def project_project_list(
     if partner:
         domain.append(("partner_id.name", "ilike", partner))
 
-    try:
-        projects = list_projects(client, domain=domain, limit=limit, fields=fields)
-        display_projects(projects)
-        console.print(f"\n[dim]Found {len(projects)} projects[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    projects = list_projects(client, domain=domain, limit=limit, fields=fields)
+    display_projects(projects)
+    console.print(f"\n[dim]Found {len(projects)} projects[/dim]")
 
 
 @project_project_app.command("show")
+@_cli_errors
 def project_project_show(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
     fields: Annotated[
@@ -1055,24 +1058,24 @@ def project_project_show(
     ] = False,
 ) -> None:
     """Show detailed project information."""
+    from odoo_ninja.project_project import display_project_detail, get_project
+
     client = get_client()
 
-    try:
-        project = get_project(client, project_id, fields=fields)
+    project = get_project(client, project_id, fields=fields)
 
-        if fields:
-            # If specific fields requested, show them directly
-            console.print(f"\n[bold cyan]Project #{project_id}[/bold cyan]\n")
-            for key, value in sorted(project.items()):
-                console.print(f"[bold]{key}:[/bold] {value}")
-        else:
-            display_project_detail(project, show_html=show_html)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    if fields:
+        # If specific fields requested, show them directly, in the order given
+        console.print(f"\n[bold cyan]Project #{project_id}[/bold cyan]\n")
+        missing = "[dim]<missing>[/dim]"
+        lines = [f"[bold]{key}:[/bold] {project.get(key, missing)}" for key in fields]
+        console.print("\n".join(lines))
+    else:
+        display_project_detail(project, show_html=show_html)
 
 
 @project_project_app.command("comment")
+@_cli_errors
 def project_project_comment(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
     message: Annotated[str, typer.Argument(help="Comment message")],
@@ -1085,6 +1088,8 @@ def project_project_comment(
     ] = False,
 ) -> None:
     """Add a comment to a project (visible to followers)."""
+    from odoo_ninja.project_project import add_comment as add_project_comment
+
     client = get_client()
 
     # Check if harmful operations are allowed
@@ -1097,21 +1102,16 @@ def project_project_comment(
         )
         raise typer.Exit(1)
 
-    try:
-        success = add_project_comment(
-            client, project_id, message, user_id=user_id, markdown=markdown
-        )
-        if success:
-            console.print(f"[green]Successfully added comment to project {project_id}[/green]")
-        else:
-            console.print(f"[red]Failed to add comment to project {project_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    success = add_project_comment(client, project_id, message, user_id=user_id, markdown=markdown)
+    if success:
+        console.print(f"[green]Successfully added comment to project {project_id}[/green]")
+    else:
+        console.print(f"[red]Failed to add comment to project {project_id}[/red]")
+        raise typer.Exit(1)
 
 
 @project_project_app.command("note")
+@_cli_errors
 def project_project_note(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
     message: Annotated[str, typer.Argument(help="Note message")],
@@ -1124,21 +1124,20 @@ def project_project_note(
     ] = False,
 ) -> None:
     """Add an internal note to a project."""
+    from odoo_ninja.project_project import add_note as add_project_note
+
     client = get_client()
 
-    try:
-        success = add_project_note(client, project_id, message, user_id=user_id, markdown=markdown)
-        if success:
-            console.print(f"[green]Successfully added note to project {project_id}[/green]")
-        else:
-            console.print(f"[red]Failed to add note to project {project_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    success = add_project_note(client, project_id, message, user_id=user_id, markdown=markdown)
+    if success:
+        console.print(f"[green]Successfully added note to project {project_id}[/green]")
+    else:
+        console.print(f"[red]Failed to add note to project {project_id}[/red]")
+        raise typer.Exit(1)
 
 
 @project_project_app.command("chatter")
+@_cli_errors
 def project_project_chatter(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
     limit: Annotated[
@@ -1149,100 +1148,116 @@ def project_project_chatter(
         bool,
         typer.Option("--html", help="Show raw HTML body instead of plain text"),
     ] = False,
+    message_types: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--type",
+            "-t",
+            help="Only show this message type, e.g. comment, email, notification "
+            "(can be used multiple times)",
+        ),
+    ] = None,
 ) -> None:
     """Show message history/chatter for a project."""
+    from odoo_ninja.base import display_messages
+    from odoo_ninja.project_project import list_project_messages
+
     client = get_client()
 
-    try:
-        messages = list_project_messages(client, project_id, limit=limit)
-        if messages:
-            display_messages(messages, show_html=show_html)
-        else:
-            console.print(f"[yellow]No messages found for project {project_id}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    messages = list_project_messages(client, project_id, limit=limit, message_types=message_types)
+    if messages:
+        display_messages(messages, show_html=show_html)
+    else:
+        console.print(f"[yellow]No messages found for project {project_id}[/yellow]")
 
 
 @project_project_app.command("attachments")
+@_cli_errors
 def project_project_attachments(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
 ) -> None:
     """List attachments for a project."""
+    from odoo_ninja.base import display_attachments
+    from odoo_ninja.project_project import list_project_attachments
+
     client = get_client()
 
-    try:
-        attachments = list_project_attachments(client, project_id)
-        if attachments:
-            display_attachments(attachments)
-            console.print(f"\n[dim]Found {len(attachments)} attachments[/dim]")
-        else:
-            console.print(f"[yellow]No attachments found for project {project_id}[/yellow]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    attachments = list_project_attachments(client, project_id)
+    if attachments:
+        display_attachments(attachments)
+        console.print(f"\n[dim]Found {len(attachments)} attachments[/dim]")
+    else:
+        console.print(f"[yellow]No attachments found for project {project_id}[/yellow]")
 
 
 @project_project_app.command("fields")
-def project_project_fields(  # noqa: PLR0912
+@_cli_errors
+def project_project_fields(
     project_id: Annotated[int | None, typer.Argument(help="Project ID (optional)")] = None,
     field_name: Annotated[
         str | None,
         typer.Option(help="Show details for a specific field"),
     ] = None,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Fetch field definitions from Odoo instead of the cache"),
+    ] = False,
 ) -> None:
     """List available fields or show field values for a specific project."""
+    from odoo_ninja.project_project import get_project, list_project_fields
+
     client = get_client()
 
-    try:
-        if project_id:
-            # Show fields for a specific project
-            project = get_project(client, project_id)
-            console.print(f"\n[bold cyan]Fields for Project #{project_id}[/bold cyan]\n")
-
-            if field_name:
-                # Show specific field
-                if field_name in project:
-                    console.print(f"[bold]{field_name}:[/bold] {project[field_name]}")
-                else:
-                    console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+    if project_id:
+        # Show fields for a specific project
+        project = get_project(client, project_id)
+        console.print(f"\n[bold cyan]Fields for Project #{project_id}[/bold cyan]\n")
+
+        if field_name:
+            # Show specific field
+            if field_name in project:
+                console.print(f"[bold]{field_name}:[/bold] {project[field_name]}")
             else:
-                # Show all fields
-                for key, value in sorted(project.items()):
-                    console.print(f"[bold]{key}:[/bold] {value}")
+                console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
         else:
-            # List all available fields
-            fields = list_project_fields(client)
-            console.print("\n[bold cyan]Available Project Fields[/bold cyan]\n")
-
-            if field_name:
-                # Show specific field definition
-                if field_name in fields:
-                    field_def = fields[field_name]
-                    console.print(f"[bold]{field_name}[/bold]")
-                    console.print(f"  Type: {field_def.get('type', 'N/A')}")
-                    console.print(f"  String: {field_def.get('string', 'N/A')}")
-                    console.print(f"  Required: {field_def.get('required', False)}")
-                    console.print(f"  Readonly: {field_def.get('readonly', False)}")
-                    if field_def.get("help"):
-                        console.print(f"  Help: {field_def['help']}")
-                else:
-                    console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+            # Show all fields
+            lines = [f"[bold]{key}:[/bold] {project[key]}" for key in sorted(project)]
+            console.print("\n".join(lines))
+    else:
+        # List all available fields, fetching only the attributes printed below
+        attributes = ["type", "string"]
+        attributes += ["required", "readonly", "help"] if field_name else []
+        fields = list_project_fields(client, attributes=attributes, refresh=refresh)
+        console.print("\n[bold cyan]Available Project Fields[/bold cyan]\n")
+
+        if field_name:
+            # Show specific field definition
+            if field_name in fields:
+                field_def = fields[field_name]
+                console.print(f"[bold]{field_name}[/bold]")
+                console.print(f"  Type: {field_def.get('type', 'N/A')}")
+                console.print(f"  String: {field_def.get('string', 'N/A')}")
+                console.print(f"  Required: {field_def.get('required', False)}")
+                console.print(f"  Readonly: {field_def.get('readonly', False)}")
+                if field_def.get("help"):
+                    console.print(f"  Help: {field_def['help']}")
             else:
-                # List all field names and types
-                for name, definition in sorted(fields.items()):
-                    field_type = definition.get("type", "unknown")
-                    field_label = definition.get("string", name)
-                    console.print(f"[cyan]{name}[/cyan] ({field_type}) - {field_label}")
+                console.print(f"[yellow]Field '{field_name}' not found[/yellow]")
+        else:
+            # List all field names and types
+            lines = [
+                f"[cyan]{name}[/cyan] ({definition.get('type', 'unknown')}) - "
+                f"{definition.get('string', name)}"
+                for name, definition in fields.items()
+            ]
+            console.print("\n".join(lines), highlight=False)
 
-                console.print(f"\n[dim]Total: {len(fields)} fields[/dim]")
-                console.print("[dim]Use --field-name to see details for a specific field[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+            console.print(f"\n[dim]Total: {len(fields)} fields[/dim]")
+            console.print("[dim]Use --field-name to see details for a specific field[/dim]")
 
 
 @project_project_app.command("set")
+@_cli_errors
 def project_project_set(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
     fields: Annotated[
@@ -1258,36 +1273,25 @@ def project_project_set(
         odoo-ninja project set 42 name="New Project Name"
         odoo-ninja project set 42 user_id=5
     """
+    from odoo_ninja.base import parse_field_assignments
+    from odoo_ninja.project_project import set_project_fields
+
     client = get_client()
 
-    # Parse field assignments
-    values: dict[str, Any] = {}
-
-    try:
-        for field_assignment in fields:
-            field, value = parse_field_assignment(
-                client, "project.project", project_id, field_assignment
-            )
-            values[field] = value
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
-
-    try:
-        success = set_project_fields(client, project_id, values)
-        if success:
-            console.print(f"[green]Successfully updated project {project_id}[/green]")
-            for field, value in values.items():
-                console.print(f"  {field} = {value}")
-        else:
-            console.print(f"[red]Failed to set fields on project {project_id}[/red]")
-            raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    values = parse_field_assignments(client, "project.project", project_id, fields)
+
+    success = set_project_fields(client, project_id, values)
+    if success:
+        console.print(f"[green]Successfully updated project {project_id}[/green]")
+        for field, value in values.items():
+            console.print(f"  {field} = {value}")
+    else:
+        console.print(f"[red]Failed to set fields on project {project_id}[/red]")
+        raise typer.Exit(1)
 
 
 @project_project_app.command("attach")
+@_cli_errors
 def project_project_attach(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
     file_path: Annotated[Path, typer.Argument(help="Path to file to attach")],
@@ -1297,36 +1301,31 @@ def project_project_attach(
     ] = None,
 ) -> None:
     """Attach a file to a project."""
+    from odoo_ninja.project_project import create_project_attachment, get_project_url
+
     client = get_client()
 
-    try:
-        attachment_id = create_project_attachment(client, project_id, file_path, name=name)
-        console.print(
-            f"[green]Successfully attached {file_path.name} to project {project_id}[/green]"
-        )
-        console.print(f"[dim]Attachment ID: {attachment_id}[/dim]")
+    attachment_id = create_project_attachment(client, project_id, file_path, name=name)
+    console.print(f"[green]Successfully attached {file_path.name} to project {project_id}[/green]")
+    console.print(f"[dim]Attachment ID: {attachment_id}[/dim]")
 
-        # Show project URL for verification
-        url = get_project_url(client, project_id)
-        console.print(f"\n[cyan]View project:[/cyan] {url}")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    # Show project URL for verification
+    url = get_project_url(client, project_id)
+    console.print(f"\n[cyan]View project:[/cyan] {url}")
 
 
 @project_project_app.command("url")
+@_cli_errors
 def project_project_url(
     project_id: Annotated[int, typer.Argument(help="Project ID")],
 ) -> None:
     """Get the web URL for a project."""
+    from odoo_ninja.project_project import get_project_url
+
     client = get_client()
 
-    try:
-        url = get_project_url(client, project_id)
-        console.print(url)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from e
+    url = get_project_url(client, project_id)
+    typer.echo(url)
 
 
 if __name__ == "__main__":
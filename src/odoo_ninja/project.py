@@ -1,27 +1,38 @@
 """Project task operations for Odoo Ninja."""
 
+from collections.abc import Iterator
 from typing import Any
 
 from odoo_ninja.base import (
-    add_comment as base_add_comment,
-)
-from odoo_ninja.base import (
-    add_note as base_add_note,
-)
-from odoo_ninja.base import (
+    DOWNLOAD_WORKERS,
+    UpdateBatch,
     add_tag_to_record,
+    add_tags_to_records,
+    aget_record,
+    aget_record_messages_attachments,
+    alist_attachments,
+    alist_messages,
     display_record_detail,
     display_records,
     display_tags,
     download_record_attachments,
     get_record,
     get_record_url,
+    get_records,
+    iter_messages,
     list_attachments,
     list_fields,
     list_messages,
     list_records,
     list_tags,
     set_record_fields,
+    set_records_fields,
+)
+from odoo_ninja.base import (
+    add_comment as base_add_comment,
+)
+from odoo_ninja.base import (
+    add_note as base_add_note,
 )
 from odoo_ninja.base import (
     create_attachment as base_create_attachment,
@@ -32,6 +43,19 @@ from odoo_ninja.client import OdooClient
 MODEL = "project.task"
 TAG_MODEL = "project.tags"
 
+# Fields fetched by list_tasks() when the caller does not ask for specific ones
+_DEFAULT_FIELDS = [
+    "id",
+    "name",
+    "partner_id",
+    "project_id",
+    "stage_id",
+    "user_ids",
+    "priority",
+    "tag_ids",
+    "create_date",
+]
+
 
 def list_tasks(
     client: OdooClient,
@@ -52,17 +76,7 @@ def list_tasks(
 
     """
     if fields is None:
-        fields = [
-            "id",
-            "name",
-            "partner_id",
-            "project_id",
-            "stage_id",
-            "user_ids",
-            "priority",
-            "tag_ids",
-            "create_date",
-        ]
+        fields = _DEFAULT_FIELDS
 
     return list_records(client, MODEL, domain=domain, limit=limit, fields=fields)
 
@@ -99,17 +113,42 @@ def get_task(
     return get_record(client, MODEL, task_id, fields=fields)
 
 
-def list_task_fields(client: OdooClient) -> dict[str, Any]:
+def get_tasks(
+    client: OdooClient,
+    task_ids: list[int],
+    fields: list[str] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Get several tasks in a single read.
+
+    Args:
+        client: Odoo client
+        task_ids: Task IDs
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Dictionary mapping task ID to task dictionary
+
+    """
+    return get_records(client, MODEL, task_ids, fields=fields)
+
+
+def list_task_fields(
+    client: OdooClient,
+    attributes: list[str] | None = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
     """Get all available fields for project tasks.
 
     Args:
         client: Odoo client
+        attributes: Field attributes to return (None = all attributes)
+        refresh: Fetch the definitions from Odoo even if they are cached
 
     Returns:
-        Dictionary of field definitions with field names as keys
+        Dictionary of field definitions with field names as keys, sorted by name
 
     """
-    return list_fields(client, MODEL)
+    return list_fields(client, MODEL, attributes=attributes, refresh=refresh)
 
 
 def set_task_fields(
@@ -135,6 +174,46 @@ def set_task_fields(
     return set_record_fields(client, MODEL, task_id, values)
 
 
+def set_tasks_fields(
+    client: OdooClient,
+    task_ids: list[int],
+    values: dict[str, Any],
+) -> bool:
+    """Set the same field values on several tasks in a single write.
+
+    Args:
+        client: Odoo client
+        task_ids: Task IDs
+        values: Dictionary of field names and values to update
+
+    Returns:
+        True if successful
+
+    Examples:
+        >>> set_tasks_fields(client, [42, 43, 44], {"stage_id": 3})
+
+    """
+    return set_records_fields(client, MODEL, task_ids, values)
+
+
+def task_update_batch(client: OdooClient) -> UpdateBatch:
+    """Collect task updates and write them with as few calls as possible.
+
+    Args:
+        client: Odoo client
+
+    Returns:
+        UpdateBatch for tasks; use it as a context manager
+
+    Examples:
+        >>> with task_update_batch(client) as batch:
+        ...     batch.set(42, {"name": "New title"})
+        ...     batch.set(42, {"stage_id": 3})
+
+    """
+    return UpdateBatch(client, MODEL)
+
+
 def display_task_detail(task: dict[str, Any], show_html: bool = False) -> None:
     """Display detailed task information.
 
@@ -234,10 +313,33 @@ def add_tag_to_task(
     return add_tag_to_record(client, MODEL, task_id, tag_id)
 
 
+def add_tag_to_tasks(
+    client: OdooClient,
+    task_ids: list[int],
+    tag_id: int,
+) -> bool:
+    """Add the same tag to several tasks in a single write.
+
+    Args:
+        client: Odoo client
+        task_ids: Task IDs
+        tag_id: Tag ID
+
+    Returns:
+        True if successful
+
+    Examples:
+        >>> add_tag_to_tasks(client, [42, 43, 44], 7)
+
+    """
+    return add_tags_to_records(client, MODEL, [(task_id, tag_id) for task_id in task_ids])
+
+
 def list_task_messages(
     client: OdooClient,
     task_id: int,
     limit: int | None = None,
+    message_types: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """List messages/chatter for a task.
 
@@ -245,29 +347,53 @@ def list_task_messages(
         client: Odoo client
         task_id: Task ID
         limit: Maximum number of messages (None = all)
+        message_types: Only list these message types, e.g. ['comment', 'email'] (None = all)
 
     Returns:
         List of message dictionaries
 
     """
-    return list_messages(client, MODEL, task_id, limit=limit)
+    return list_messages(client, MODEL, task_id, limit=limit, message_types=message_types)
+
+
+def iter_task_messages(
+    client: OdooClient,
+    task_id: int,
+    message_types: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over a task's messages, fetching them page by page.
+
+    Args:
+        client: Odoo client
+        task_id: Task ID
+        message_types: Only yield these message types (None = all)
+
+    Yields:
+        Message dictionaries, newest first
+
+    """
+    yield from iter_messages(client, MODEL, task_id, message_types=message_types)
 
 
 def list_task_attachments(
     client: OdooClient,
     task_id: int,
+    fields: list[str] | None = None,
+    extension: str | None = None,
 ) -> list[dict[str, Any]]:
     """List attachments for a task.
 
     Args:
         client: Odoo client
         task_id: Task ID
+        fields: List of fields to fetch (None = fields used by display_attachments)
+        extension: Only list files with this extension (e.g., 'pdf')
 
     Returns:
         List of attachment dictionaries
 
     """
-    return list_attachments(client, MODEL, task_id)
+    return list_attachments(client, MODEL, task_id, fields=fields, extension=extension)
 
 
 def download_task_attachments(
@@ -275,6 +401,9 @@ def download_task_attachments(
     task_id: int,
     output_dir: Any = None,
     extension: str | None = None,
+    *,
+    max_workers: int = DOWNLOAD_WORKERS,
+    attachments: list[dict[str, Any]] | None = None,
 ) -> list[Any]:
     """Download all attachments from a task.
 
@@ -283,12 +412,22 @@ def download_task_attachments(
         task_id: Task ID
         output_dir: Output directory (defaults to current directory)
         extension: File extension filter (e.g., 'pdf', 'jpg')
+        max_workers: Number of files decoded and written in parallel
+        attachments: Attachment records already fetched with 'name' and 'datas'
 
     Returns:
         List of paths to downloaded files
 
     """
-    return download_record_attachments(client, MODEL, task_id, output_dir, extension=extension)
+    return download_record_attachments(
+        client,
+        MODEL,
+        task_id,
+        output_dir,
+        extension=extension,
+        max_workers=max_workers,
+        attachments=attachments,
+    )
 
 
 def create_task_attachment(
@@ -324,3 +463,80 @@ def get_task_url(client: OdooClient, task_id: int) -> str:
 
     """
     return get_record_url(client, MODEL, task_id)
+
+
+async def aget_task(
+    client: OdooClient,
+    task_id: int,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Async variant of get_task.
+
+    Args:
+        client: Odoo client
+        task_id: Task ID
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Task dictionary
+
+    """
+    return await aget_record(client, MODEL, task_id, fields)
+
+
+async def alist_task_messages(
+    client: OdooClient,
+    task_id: int,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Async variant of list_task_messages.
+
+    Args:
+        client: Odoo client
+        task_id: Task ID
+        limit: Maximum number of messages (None = all)
+
+    Returns:
+        List of message dictionaries
+
+    """
+    return await alist_messages(client, MODEL, task_id, limit)
+
+
+async def alist_task_attachments(
+    client: OdooClient,
+    task_id: int,
+) -> list[dict[str, Any]]:
+    """Async variant of list_task_attachments.
+
+    Args:
+        client: Odoo client
+        task_id: Task ID
+
+    Returns:
+        List of attachment dictionaries
+
+    """
+    return await alist_attachments(client, MODEL, task_id)
+
+
+async def aget_task_bundle(
+    client: OdooClient,
+    task_id: int,
+    fields: list[str] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch a task together with its messages and attachments concurrently.
+
+    Args:
+        client: Odoo client
+        task_id: Task ID
+        fields: List of field names to read on the task (None = all fields)
+
+    Returns:
+        Tuple of (task, messages, attachments)
+
+    Examples:
+        >>> task, messages, attachments = asyncio.run(aget_task_bundle(client, 42))
+
+    """
+    return await aget_record_messages_attachments(client, MODEL, task_id, fields)
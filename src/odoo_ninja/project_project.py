@@ -3,30 +3,49 @@
 from typing import Any
 
 from odoo_ninja.base import (
-    add_comment as base_add_comment,
-)
-from odoo_ninja.base import (
-    add_note as base_add_note,
-)
-from odoo_ninja.base import (
-    create_attachment as base_create_attachment,
-)
-from odoo_ninja.base import (
+    UpdateBatch,
+    aget_record,
+    aget_record_messages_attachments,
+    alist_attachments,
+    alist_messages,
     display_record_detail,
     display_records,
     get_record,
     get_record_url,
+    get_records,
     list_attachments,
     list_fields,
     list_messages,
     list_records,
     set_record_fields,
+    set_records_fields,
+)
+from odoo_ninja.base import (
+    add_comment as base_add_comment,
+)
+from odoo_ninja.base import (
+    add_note as base_add_note,
+)
+from odoo_ninja.base import (
+    create_attachment as base_create_attachment,
 )
 from odoo_ninja.client import OdooClient
 
 # Model name constant
 MODEL = "project.project"
 
+# Fields fetched by list_projects() when the caller does not ask for specific ones
+_DEFAULT_FIELDS = [
+    "id",
+    "name",
+    "user_id",
+    "partner_id",
+    "date_start",
+    "date",
+    "task_count",
+    "color",
+]
+
 
 def list_projects(
     client: OdooClient,
@@ -47,16 +66,7 @@ def list_projects(
 
     """
     if fields is None:
-        fields = [
-            "id",
-            "name",
-            "user_id",
-            "partner_id",
-            "date_start",
-            "date",
-            "task_count",
-            "color",
-        ]
+        fields = _DEFAULT_FIELDS
 
     return list_records(client, MODEL, domain=domain, limit=limit, fields=fields)
 
@@ -93,17 +103,42 @@ def get_project(
     return get_record(client, MODEL, project_id, fields=fields)
 
 
-def list_project_fields(client: OdooClient) -> dict[str, Any]:
+def get_projects(
+    client: OdooClient,
+    project_ids: list[int],
+    fields: list[str] | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Get several projects in a single read.
+
+    Args:
+        client: Odoo client
+        project_ids: Project IDs
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Dictionary mapping project ID to project dictionary
+
+    """
+    return get_records(client, MODEL, project_ids, fields=fields)
+
+
+def list_project_fields(
+    client: OdooClient,
+    attributes: list[str] | None = None,
+    refresh: bool = False,
+) -> dict[str, Any]:
     """Get all available fields for projects.
 
     Args:
         client: Odoo client
+        attributes: Field attributes to return (None = all attributes)
+        refresh: Fetch the definitions from Odoo even if they are cached
 
     Returns:
-        Dictionary of field definitions with field names as keys
+        Dictionary of field definitions with field names as keys, sorted by name
 
     """
-    return list_fields(client, MODEL)
+    return list_fields(client, MODEL, attributes=attributes, refresh=refresh)
 
 
 def set_project_fields(
@@ -129,6 +164,46 @@ def set_project_fields(
     return set_record_fields(client, MODEL, project_id, values)
 
 
+def set_projects_fields(
+    client: OdooClient,
+    project_ids: list[int],
+    values: dict[str, Any],
+) -> bool:
+    """Set the same field values on several projects in a single write.
+
+    Args:
+        client: Odoo client
+        project_ids: Project IDs
+        values: Dictionary of field names and values to update
+
+    Returns:
+        True if successful
+
+    Examples:
+        >>> set_projects_fields(client, [42, 43, 44], {"user_id": 5})
+
+    """
+    return set_records_fields(client, MODEL, project_ids, values)
+
+
+def project_update_batch(client: OdooClient) -> UpdateBatch:
+    """Collect project updates and write them with as few calls as possible.
+
+    Args:
+        client: Odoo client
+
+    Returns:
+        UpdateBatch for projects; use it as a context manager
+
+    Examples:
+        >>> with project_update_batch(client) as batch:
+        ...     batch.set(42, {"name": "New title"})
+        ...     batch.set(42, {"user_id": 5})
+
+    """
+    return UpdateBatch(client, MODEL)
+
+
 def display_project_detail(project: dict[str, Any], show_html: bool = False) -> None:
     """Display detailed project information.
 
@@ -190,6 +265,7 @@ def list_project_messages(
     client: OdooClient,
     project_id: int,
     limit: int | None = None,
+    message_types: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """List messages/chatter for a project.
 
@@ -197,29 +273,34 @@ def list_project_messages(
         client: Odoo client
         project_id: Project ID
         limit: Maximum number of messages (None = all)
+        message_types: Only list these message types, e.g. ['comment', 'email'] (None = all)
 
     Returns:
         List of message dictionaries
 
     """
-    return list_messages(client, MODEL, project_id, limit=limit)
+    return list_messages(client, MODEL, project_id, limit=limit, message_types=message_types)
 
 
 def list_project_attachments(
     client: OdooClient,
     project_id: int,
+    fields: list[str] | None = None,
+    extension: str | None = None,
 ) -> list[dict[str, Any]]:
     """List attachments for a project.
 
     Args:
         client: Odoo client
         project_id: Project ID
+        fields: List of fields to fetch (None = fields used by display_attachments)
+        extension: Only list files with this extension (e.g., 'pdf')
 
     Returns:
         List of attachment dictionaries
 
     """
-    return list_attachments(client, MODEL, project_id)
+    return list_attachments(client, MODEL, project_id, fields=fields, extension=extension)
 
 
 def create_project_attachment(
@@ -255,3 +336,80 @@ def get_project_url(client: OdooClient, project_id: int) -> str:
 
     """
     return get_record_url(client, MODEL, project_id)
+
+
+async def aget_project(
+    client: OdooClient,
+    project_id: int,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Async variant of get_project.
+
+    Args:
+        client: Odoo client
+        project_id: Project ID
+        fields: List of field names to read (None = all fields)
+
+    Returns:
+        Project dictionary
+
+    """
+    return await aget_record(client, MODEL, project_id, fields)
+
+
+async def alist_project_messages(
+    client: OdooClient,
+    project_id: int,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Async variant of list_project_messages.
+
+    Args:
+        client: Odoo client
+        project_id: Project ID
+        limit: Maximum number of messages (None = all)
+
+    Returns:
+        List of message dictionaries
+
+    """
+    return await alist_messages(client, MODEL, project_id, limit)
+
+
+async def alist_project_attachments(
+    client: OdooClient,
+    project_id: int,
+) -> list[dict[str, Any]]:
+    """Async variant of list_project_attachments.
+
+    Args:
+        client: Odoo client
+        project_id: Project ID
+
+    Returns:
+        List of attachment dictionaries
+
+    """
+    return await alist_attachments(client, MODEL, project_id)
+
+
+async def aget_project_bundle(
+    client: OdooClient,
+    project_id: int,
+    fields: list[str] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch a project together with its messages and attachments concurrently.
+
+    Args:
+        client: Odoo client
+        project_id: Project ID
+        fields: List of field names to read on the project (None = all fields)
+
+    Returns:
+        Tuple of (project, messages, attachments)
+
+    Examples:
+        >>> project, messages, attachments = asyncio.run(aget_project_bundle(client, 42))
+
+    """
+    return await aget_record_messages_attachments(client, MODEL, project_id, fields)